@@ -1,4 +1,30 @@
+import json
 import os
 
+import pytest
+import requests
+
 os.environ.setdefault("OWM_API_KEY", "test")
 os.environ.setdefault("GOOGLE_MAPS_API_KEY", "test")
+
+
+class FakeResponse:
+    """Minimal stand-in for ``requests.Response`` carrying a JSON payload."""
+
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+        self.content = json.dumps(payload).encode()
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+    def json(self):
+        return self._payload
+
+
+@pytest.fixture
+def fake_response():
+    return FakeResponse
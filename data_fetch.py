@@ -8,11 +8,12 @@ with resilient retries via a shared requests.Session.
 
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import pytz
 import requests
 
-from services.http_client import NHL_HEADERS, get_session
+from services.http_client import NHL_HEADERS, decode_json, get_session
 from screens.nba_scoreboard import _fetch_games_for_date as _nba_fetch_games_for_date
 
 from config import (
@@ -657,7 +658,7 @@ def _fetch_mlb_standings(league_id, division_id, team_id):
         )
         r = _session.get(url, timeout=10)
         r.raise_for_status()
-        data = r.json()
+        data = decode_json(r)
 
         for rec in data.get("records", []):
             for tr in rec.get("teamRecords", []):
@@ -678,3 +679,56 @@ def fetch_cubs_standings():
 
 def fetch_sox_standings():
     return _fetch_mlb_standings(103, 202, MLB_SOX_TEAM_ID)
+
+
+# -----------------------------------------------------------------------------
+# All feeds — fetched concurrently for the screen cache
+# -----------------------------------------------------------------------------
+_FEED_WORKERS = 6
+
+
+def fetch_all_feeds():
+    """Fetch every feed the screen cache needs, overlapping the network waits.
+
+    Returns a dict shaped like the screen cache: ``weather`` plus per-team
+    dicts for ``hawks``, ``bulls``, ``cubs`` and ``sox``.
+    """
+    fetchers = {
+        "weather": fetch_weather,
+        "hawks_last": fetch_blackhawks_last_game,
+        "hawks_live": fetch_blackhawks_live_game,
+        "hawks_next": fetch_blackhawks_next_game,
+        "hawks_next_home": fetch_blackhawks_next_home_game,
+        "bulls_last": fetch_bulls_last_game,
+        "bulls_live": fetch_bulls_live_game,
+        "bulls_next": fetch_bulls_next_game,
+        "bulls_next_home": fetch_bulls_next_home_game,
+        "cubs_games": fetch_cubs_games,
+        "cubs_stand": fetch_cubs_standings,
+        "sox_games": fetch_sox_games,
+        "sox_stand": fetch_sox_standings,
+    }
+    # Every fetcher is I/O bound on the shared session, so threads overlap the
+    # round trips instead of paying for them one after another.
+    with ThreadPoolExecutor(max_workers=_FEED_WORKERS) as pool:
+        futures = {key: pool.submit(fetch) for key, fetch in fetchers.items()}
+        results = {key: future.result() for key, future in futures.items()}
+
+    feeds = {"weather": results["weather"]}
+    for team in ("hawks", "bulls"):
+        feeds[team] = {
+            "last": results[f"{team}_last"],
+            "live": results[f"{team}_live"],
+            "next": results[f"{team}_next"],
+            "next_home": results[f"{team}_next_home"],
+        }
+    for team in ("cubs", "sox"):
+        games = results[f"{team}_games"] or {}
+        feeds[team] = {
+            "stand": results[f"{team}_stand"],
+            "last": games.get("last_game"),
+            "live": games.get("live_game"),
+            "next": games.get("next_game"),
+            "next_home": games.get("next_home_game"),
+        }
+    return feeds
@@ -54,7 +54,7 @@ from utils import (
     animate_fade_in,
 )
 import data_fetch
-from services import wifi_utils  # for wifi_utils.wifi_status
+from services import wifi_utils  # for wifi_utils.get_state()
 
 from screens.draw_date_time import draw_date, draw_time
 from screens.draw_travel_time import (
@@ -268,6 +268,7 @@ def maybe_archive_screenshots():
 # ─── SIGTERM handler ─────────────────────────────────────────────────────────
 def _handle_sigterm(signum, frame):
     logging.info("✋ SIGTERM caught—clearing display & finalizing video…")
+    wifi_utils.stop_monitor()
     try:
         clear_display(display)
     except Exception:
@@ -335,35 +336,10 @@ cache = {
 
 def refresh_all():
     logging.info("🔄 Refreshing all data…")
-    cache["weather"] = data_fetch.fetch_weather()
-    cache["hawks"].update({
-        "last": data_fetch.fetch_blackhawks_last_game(),
-        "live": data_fetch.fetch_blackhawks_live_game(),
-        "next": data_fetch.fetch_blackhawks_next_game(),
-        "next_home": data_fetch.fetch_blackhawks_next_home_game(),
-    })
-    cache["bulls"].update({
-        "last": data_fetch.fetch_bulls_last_game(),
-        "live": data_fetch.fetch_bulls_live_game(),
-        "next": data_fetch.fetch_bulls_next_game(),
-        "next_home": data_fetch.fetch_bulls_next_home_game(),
-    })
-    cubg = data_fetch.fetch_cubs_games() or {}
-    cache["cubs"].update({
-        "stand": data_fetch.fetch_cubs_standings(),
-        "last":  cubg.get("last_game"),
-        "live":  cubg.get("live_game"),
-        "next":  cubg.get("next_game"),
-        "next_home": cubg.get("next_home_game"),
-    })
-    soxg = data_fetch.fetch_sox_games() or {}
-    cache["sox"].update({
-        "stand": data_fetch.fetch_sox_standings(),
-        "last":  soxg.get("last_game"),
-        "live":  soxg.get("live_game"),
-        "next":  soxg.get("next_game"),
-        "next_home": soxg.get("next_home_game"),
-    })
+    feeds = data_fetch.fetch_all_feeds()
+    cache["weather"] = feeds["weather"]
+    for team in ("hawks", "bulls", "cubs", "sox"):
+        cache[team].update(feeds[team])
 
 threading.Thread(
     target=lambda: (time.sleep(30),
@@ -386,14 +362,15 @@ def main_loop():
             refresh_schedule_if_needed()
 
             # Wi-Fi outage handling
-            if ENABLE_WIFI_MONITOR and wifi_utils.wifi_status != "ok":
+            wifi_status, wifi_ssid = wifi_utils.get_state()
+            if ENABLE_WIFI_MONITOR and wifi_status != "ok":
                 img = Image.new("RGB", (WIDTH, HEIGHT), "black")
                 d   = ImageDraw.Draw(img)
-                if wifi_utils.wifi_status == "no_wifi":
+                if wifi_status == "no_wifi":
                     draw_text_centered(d, "No Wi-Fi.", FONT_DATE_SPORTS, fill=(255,0,0))
                 else:
                     draw_text_centered(d, "Wi-Fi ok.",     FONT_DATE_SPORTS, y_offset=-12, fill=(255,255,0))
-                    draw_text_centered(d, wifi_utils.current_ssid or "", FONT_DATE_SPORTS, fill=(255,255,0))
+                    draw_text_centered(d, wifi_ssid or "", FONT_DATE_SPORTS, fill=(255,255,0))
                     draw_text_centered(d, "No internet.",  FONT_DATE_SPORTS, y_offset=12,  fill=(255,0,0))
                 display.image(img); display.show(); time.sleep(SCREEN_DELAY)
                 for fn in (draw_date, draw_time):
@@ -125,45 +125,10 @@ def build_cache() -> Dict[str, object]:
         },
     }
 
-    cache["weather"] = data_fetch.fetch_weather()
-    cache["hawks"].update(
-        {
-            "last": data_fetch.fetch_blackhawks_last_game(),
-            "live": data_fetch.fetch_blackhawks_live_game(),
-            "next": data_fetch.fetch_blackhawks_next_game(),
-            "next_home": data_fetch.fetch_blackhawks_next_home_game(),
-        }
-    )
-    cache["bulls"].update(
-        {
-            "last": data_fetch.fetch_bulls_last_game(),
-            "live": data_fetch.fetch_bulls_live_game(),
-            "next": data_fetch.fetch_bulls_next_game(),
-            "next_home": data_fetch.fetch_bulls_next_home_game(),
-        }
-    )
-
-    cubs_games = data_fetch.fetch_cubs_games() or {}
-    cache["cubs"].update(
-        {
-            "stand": data_fetch.fetch_cubs_standings(),
-            "last": cubs_games.get("last_game"),
-            "live": cubs_games.get("live_game"),
-            "next": cubs_games.get("next_game"),
-            "next_home": cubs_games.get("next_home_game"),
-        }
-    )
-
-    sox_games = data_fetch.fetch_sox_games() or {}
-    cache["sox"].update(
-        {
-            "stand": data_fetch.fetch_sox_standings(),
-            "last": sox_games.get("last_game"),
-            "live": sox_games.get("live_game"),
-            "next": sox_games.get("next_game"),
-            "next_home": sox_games.get("next_home_game"),
-        }
-    )
+    feeds = data_fetch.fetch_all_feeds()
+    cache["weather"] = feeds["weather"]
+    for team in ("hawks", "bulls", "cubs", "sox"):
+        cache[team].update(feeds[team])
 
     return cache
 
@@ -3,13 +3,13 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set
 
-from screens_catalog import SCREEN_IDS
+from screens_catalog import SCREEN_ID_SET
 from screens.registry import ScreenDefinition
 
 
-KNOWN_SCREENS: Set[str] = set(SCREEN_IDS)
+KNOWN_SCREENS: FrozenSet[str] = SCREEN_ID_SET
 
 
 @dataclass
@@ -52,7 +52,7 @@ from config import (
     WIDTH,
     HEIGHT,
 )
-from services.http_client import NHL_HEADERS, get_session, request_json
+from services.http_client import NHL_HEADERS, cached_json, get_session
 
 TS_PATH = TIMES_SQUARE_FONT_PATH
 NHL_DIR = NHL_IMAGES_DIR
@@ -137,12 +137,19 @@ def _push(display, img: Optional[Image.Image], *, transition: bool=False):
 _SESSION = get_session()
 
 
-def _req_json(url: str, **kwargs) -> Optional[Dict]:
-    """GET → JSON with optional quiet logging (quiet=True)."""
+# The last/live/next screens all read the team schedule within one rotation,
+# and it is revalidated rather than re-downloaded once the TTL lapses; a
+# finished game's boxscore never changes.
+SCHEDULE_TTL = 60
+FINAL_FEED_TTL = 60 * 60
+
+
+def _req_json(url: str, ttl: float = 0, **kwargs) -> Optional[Dict]:
+    """GET → JSON with optional quiet logging (quiet=True), reused for *ttl* seconds."""
     headers = kwargs.pop("headers", None)
     if headers is None and "api-web.nhle.com" in url:
         headers = NHL_HEADERS
-    return request_json(url, headers=headers, session=_SESSION, **kwargs)
+    return cached_json(url, ttl=ttl, headers=headers, session=_SESSION, **kwargs)
 
 def _map_apiweb_game(g: Dict) -> Dict:
     """Map api-web game into a minimal StatsAPI-like shape."""
@@ -188,9 +195,9 @@ def _map_apiweb_game(g: Dict) -> Dict:
 
 def fetch_schedule_apiweb(days_back: int, days_fwd: int) -> Optional[Dict]:
     """api-web 'season now' (broader) or 'month now' mapped to {dates:[{games:[...]}}]."""
-    j = _req_json(NHL_WEB_TEAM_SEASON_NOW.format(tric=TEAM_TRICODE))
+    j = _req_json(NHL_WEB_TEAM_SEASON_NOW.format(tric=TEAM_TRICODE), ttl=SCHEDULE_TTL, revalidate=True)
     if not j:
-        j = _req_json(NHL_WEB_TEAM_MONTH_NOW.format(tric=TEAM_TRICODE))
+        j = _req_json(NHL_WEB_TEAM_MONTH_NOW.format(tric=TEAM_TRICODE), ttl=SCHEDULE_TTL, revalidate=True)
     if not j:
         return None
     games = j.get("games") or j.get("gameWeek", []) or j.get("gameMonth", []) or []
@@ -212,7 +219,12 @@ def fetch_schedule_legacy(days_back: int, days_fwd: int) -> Optional[Dict]:
     today = dt.date.today()
     start = (today - dt.timedelta(days=days_back)).strftime("%Y-%m-%d")
     end   = (today + dt.timedelta(days=days_fwd)).strftime("%Y-%m-%d")
-    return _req_json(NHL_STATS_SCHEDULE, params={"teamId": TEAM_ID, "startDate": start, "endDate": end}, quiet=True)
+    return _req_json(
+        NHL_STATS_SCHEDULE,
+        ttl=SCHEDULE_TTL,
+        params={"teamId": TEAM_ID, "startDate": start, "endDate": end},
+        quiet=True,
+    )
 
 def fetch_schedule(days_back: int, days_fwd: int) -> Optional[Dict]:
     j = fetch_schedule_apiweb(days_back, days_fwd)
@@ -236,10 +248,10 @@ def classify_games(schedule_json: Dict) -> Tuple[Optional[Dict], Optional[Dict],
 
     return live, last_final, next_sched
 
-def fetch_game_feed(game_pk: int) -> Optional[Dict]:
+def fetch_game_feed(game_pk: int, ttl: float = 0) -> Optional[Dict]:
     """Prefer api-web boxscore/landing (goals + SOG). Quiet legacy fallback."""
-    box  = _req_json(NHL_WEB_GAME_BOXSCORE.format(gid=game_pk))
-    land = None if box else _req_json(NHL_WEB_GAME_LANDING.format(gid=game_pk))
+    box  = _req_json(NHL_WEB_GAME_BOXSCORE.format(gid=game_pk), ttl=ttl)
+    land = None if box else _req_json(NHL_WEB_GAME_LANDING.format(gid=game_pk), ttl=ttl)
     payload = box or land
     if payload:
         home = payload.get("homeTeam") or payload.get("home") or {}
@@ -283,7 +295,7 @@ def fetch_game_feed(game_pk: int) -> Optional[Dict]:
 
     # legacy fallback (quiet)
     url = NHL_STATS_FEED.format(gamePk=game_pk)
-    data = _req_json(url, quiet=True)
+    data = _req_json(url, ttl=ttl, quiet=True)
     if not data:
         return None
 
@@ -927,7 +939,7 @@ def draw_last_hawks_game(display, game, transition: bool=False):
         return None
 
     game_pk = last_final.get("gamePk")
-    feed = fetch_game_feed(game_pk) if game_pk else None
+    feed = fetch_game_feed(game_pk, ttl=FINAL_FEED_TTL) if game_pk else None
     if not feed:
         logging.warning("hawks last: no boxscore/feed")
         return None
@@ -16,6 +16,7 @@ from typing import List, Dict, Optional, Tuple
 from PIL import Image, ImageDraw
 
 import config
+from services.http_client import decode_json
 from utils import clear_display, get_mlb_abbreviation, log_call
 from screens.mlb_team_standings import format_games_back
 
@@ -51,6 +52,11 @@ LEAGUE_DIVISION_IDS: Dict[int, Dict[str, int]] = {
 # ./screens/images/mlb folder.
 LOGOS_DIR = os.path.join(config.IMAGES_DIR, "mlb")
 TIMEOUT   = 10
+CACHE_TTL = 5 * 60    # seconds a standings response is reused across screens
+
+# url -> (monotonic fetch time, records); one league response serves the
+# overview and all three division screens.
+_RECORDS_CACHE: Dict[str, Tuple[float, List[dict]]] = {}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -65,18 +71,31 @@ def _sort_by_int_key(items: List[dict], key: str) -> List[dict]:
             return 999
     return sorted(items, key=_k)
 
+def _fetch_records(url: str) -> List[dict]:
+    """
+    Return the "records" list for a standings URL, reusing a response that is
+    younger than CACHE_TTL.
+    """
+    now = time.monotonic()
+    cached = _RECORDS_CACHE.get(url)
+    if cached and now - cached[0] < CACHE_TTL:
+        return cached[1]
+    r = requests.get(url, timeout=TIMEOUT)
+    r.raise_for_status()
+    records = decode_json(r).get("records", []) or []
+    _RECORDS_CACHE[url] = (now, records)
+    return records
+
 def fetch_division_records(league_id: int, division_id: int) -> List[dict]:
     """
     Return teamRecords for a given league+division, sorted by divisionRank (1..N).
     """
     url = (
         "https://statsapi.mlb.com/api/v1/standings"
-        f"?season=2025&leagueId={league_id}&divisionId={division_id}"
+        f"?season=2025&leagueId={league_id}"
     )
     try:
-        r = requests.get(url, timeout=TIMEOUT)
-        r.raise_for_status()
-        records = r.json().get("records", [])
+        records = _fetch_records(url)
         rec = next(
             (x for x in records if x.get("division", {}).get("id") == division_id),
             None
@@ -98,9 +117,7 @@ def fetch_wildcard_records(league_id: int) -> List[dict]:
         f"?season=2025&leagueId={league_id}&standingsTypes=wildCard"
     )
     try:
-        r = requests.get(url, timeout=TIMEOUT)
-        r.raise_for_status()
-        data = r.json().get("records", [])
+        data = _fetch_records(url)
         teams = (data[0].get("teamRecords", []) if data else []) or []
         return _sort_by_int_key(teams, "wildCardRank")
     except Exception as e:
@@ -9,6 +9,7 @@ Screen 1: logo at top center, then W-L, rank, GB, WCGB with:
   - “n” for everyone else
 Screen 2: logo at top center, then overall record and splits.
 """
+import functools
 import os
 import time
 from PIL import Image, ImageDraw
@@ -59,6 +60,21 @@ def format_games_back(gb):
         pass
     return str(gb)
 
+@functools.lru_cache(maxsize=8)
+def _load_logo(logo_path, square):
+    """
+    Decode and size a team logo once; both screens show it on every rotation.
+    Screen 1 keeps the aspect ratio at LOGO_SZ tall, screen 2 squares it.
+    """
+    try:
+        logo_img = Image.open(logo_path).convert("RGBA")
+        if square:
+            return logo_img.resize((LOGO_SZ,LOGO_SZ), Image.ANTIALIAS)
+        ratio = LOGO_SZ / logo_img.height
+        return logo_img.resize((int(logo_img.width*ratio), LOGO_SZ), Image.ANTIALIAS)
+    except Exception:
+        return None
+
 @log_call
 def draw_standings_screen1(display, rec, logo_path, division_name, transition=False):
     """
@@ -72,13 +88,7 @@ def draw_standings_screen1(display, rec, logo_path, division_name, transition=Fa
     draw = ImageDraw.Draw(img)
 
     # Logo
-    logo = None
-    try:
-        logo_img = Image.open(logo_path).convert("RGBA")
-        ratio    = LOGO_SZ / logo_img.height
-        logo     = logo_img.resize((int(logo_img.width*ratio), LOGO_SZ), Image.ANTIALIAS)
-    except:
-        pass
+    logo = _load_logo(logo_path, square=False)
     if logo:
         x0 = (WIDTH - logo.width)//2
         img.paste(logo,(x0,0),logo)
@@ -164,12 +174,7 @@ def draw_standings_screen2(display, rec, logo_path, transition=False):
     draw = ImageDraw.Draw(img)
 
     # Logo
-    logo = None
-    try:
-        logo_img = Image.open(logo_path).convert("RGBA")
-        logo     = logo_img.resize((LOGO_SZ,LOGO_SZ), Image.ANTIALIAS)
-    except:
-        pass
+    logo = _load_logo(logo_path, square=True)
     if logo:
         x0 = (WIDTH-LOGO_SZ)//2
         img.paste(logo,(x0,0),logo)
@@ -5,14 +5,19 @@ from __future__ import annotations
 
 import csv
 import datetime
+import functools
 import io
 import logging
 import os
 import re
 import time
 from collections.abc import Iterable
-from typing import Any, Dict, Iterable as _Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable as _Iterable, List, Optional, Tuple
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 from config import (
@@ -23,7 +28,15 @@ from config import (
     IMAGES_DIR,
 )
 from services.http_client import get_session
-from utils import ScreenImage, clear_display, clone_font, load_team_logo, log_call
+from utils import (
+    ScreenImage,
+    clear_display,
+    clone_font,
+    load_team_logo,
+    log_call,
+    scroll_vertical,
+    sleep_until,
+)
 
 # ─── Constants ────────────────────────────────────────────────────────────────
 TITLE_NFC = "NFC Standings"
@@ -71,14 +84,75 @@ COLUMN_FONT = clone_font(FONT_STATUS, 13)
 ROW_FONT = clone_font(FONT_STATUS, 15)
 
 WHITE = (255, 255, 255)
+# Text-only frames are drawn on single-channel "L" canvases and converted to
+# RGB once; the panel is an RGB SSD1351 so logo frames stay in RGB.
+MONO_WHITE = 255
 
 _SESSION = get_session()
 
-_MEASURE_IMG = Image.new("RGB", (1, 1))
+_MEASURE_IMG = Image.new("L", (1, 1))
 _MEASURE_DRAW = ImageDraw.Draw(_MEASURE_IMG)
+# Resolved once so text measurement never needs a try/except per call.
+_HAS_TEXTBBOX = hasattr(ImageDraw.ImageDraw, "textbbox")
+
+
+@dataclass(frozen=True)
+class TeamRows:
+    """Column-oriented records for one division, in display order.
+
+    Record strings are formatted once per fetch so re-renders never call
+    ``str()`` or ``dict.get`` per row.
+    """
+
+    abbrs: Tuple[str, ...] = ()
+    wins: Tuple[int, ...] = ()
+    losses: Tuple[int, ...] = ()
+    ties: Tuple[int, ...] = ()
+    wins_str: Tuple[str, ...] = ()
+    losses_str: Tuple[str, ...] = ()
+    ties_str: Tuple[str, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.abbrs)
+
+    @classmethod
+    def from_teams(cls, teams: Iterable[dict]) -> "TeamRows":
+        abbrs: List[str] = []
+        wins: List[int] = []
+        losses: List[int] = []
+        ties: List[int] = []
+        for team in teams:
+            abbrs.append(team.get("abbr", ""))
+            wins.append(team.get("wins", 0))
+            losses.append(team.get("losses", 0))
+            ties.append(team.get("ties", 0))
+        return cls(
+            abbrs=tuple(abbrs),
+            wins=tuple(wins),
+            losses=tuple(losses),
+            ties=tuple(ties),
+            wins_str=tuple(str(value) for value in wins),
+            losses_str=tuple(str(value) for value in losses),
+            ties_str=tuple(str(value) for value in ties),
+        )
+
+
+_EMPTY_ROWS = TeamRows()
+
+
+@dataclass(slots=True)
+class _StandingsCache:
+    data: Optional[dict[str, dict[str, TeamRows]]] = None
+    timestamp: float = 0.0
+    message: Optional[str] = None
 
-_STANDINGS_CACHE: Dict[str, Any] = {"timestamp": 0.0, "data": None, "message": None}
-_LOGO_CACHE: Dict[str, Optional[Image.Image]] = {}
+
+# RGB bitmap plus its "L" alpha mask, split once so pastes never have to
+# convert the RGBA logo again; the soft mask keeps anti-aliased edges.
+_LogoBitmap = Tuple[Image.Image, Image.Image]
+
+_STANDINGS_CACHE = _StandingsCache()
+_LOGO_CACHE: Dict[str, Optional[_LogoBitmap]] = {}
 _OVERVIEW_LOGO_CACHE: Dict[str, Optional[Image.Image]] = {}
 
 _CONFERENCE_ALIASES = {
@@ -87,6 +161,8 @@ _CONFERENCE_ALIASES = {
 }
 
 _DIRECTION_KEYWORDS = ("EAST", "WEST", "NORTH", "SOUTH")
+# Exact-type check for JSON containers; json.loads never yields subclasses.
+_CONTAINER_TYPES = (dict, list)
 _DIVISION_PATTERN = re.compile(r"\b(AFC|NFC)\s+(EAST|WEST|NORTH|SOUTH)\b", re.IGNORECASE)
 
 DIVISION_ORDER_NFC = ["NFC North", "NFC East", "NFC South", "NFC West"]
@@ -107,12 +183,19 @@ COLUMN_HEADERS: List[tuple[str, str, str]] = [
 
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=512)
+def _measure(text: str, font) -> Tuple[int, int, int, int]:
+    """Return the ``(left, top, right, bottom)`` box of *text*, cached per font."""
+
+    if _HAS_TEXTBBOX:
+        return _MEASURE_DRAW.textbbox((0, 0), text, font=font)
+    w, h = _MEASURE_DRAW.textsize(text, font)  # pragma: no cover - Pillow < 8
+    return 0, 0, w, h
+
+
 def _text_size(text: str, font) -> tuple[int, int]:
-    try:
-        l, t, r, b = _MEASURE_DRAW.textbbox((0, 0), text, font=font)
-        return r - l, b - t
-    except Exception:  # pragma: no cover - PIL fallback
-        return _MEASURE_DRAW.textsize(text, font)
+    l, t, r, b = _measure(text, font)
+    return r - l, b - t
 
 
 ROW_TEXT_HEIGHT = _text_size("CHI", ROW_FONT)[1]
@@ -123,9 +206,51 @@ DIVISION_TEXT_HEIGHT = _text_size("NFC North", DIVISION_FONT)[1]
 TITLE_TEXT_HEIGHT = _text_size(TITLE_NFC, TITLE_FONT)[1]
 
 
+def _column_header_metrics() -> List[Tuple[str, int, int]]:
+    metrics: List[Tuple[str, int, int]] = []
+    for label, key, align in COLUMN_HEADERS:
+        l, t, r, _ = _measure(label, COLUMN_FONT)
+        x = COLUMN_LAYOUT[key]
+        metrics.append((label, x - (r - l) if align == "right" else x - l, t))
+    return metrics
+
+
+def _draw_centered(draw: ImageDraw.ImageDraw, text: str, font, y: int, fill) -> None:
+    """Draw *text* horizontally centred with its ink box starting at *y*."""
+
+    l, t, r, _ = _measure(text, font)
+    draw.text(((WIDTH - (r - l)) // 2 - l, y - t), text, font=font, fill=fill)
+
+
+def _pos_left(text: str, font, x: int, y_top: int) -> Tuple[int, int]:
+    """Return the draw origin that puts *text*'s ink box at ``(x, y_top)``."""
+
+    l, t, _, _ = _measure(text, font)
+    return x - l, y_top - t
+
+
+def _pos_right(text: str, font, x_right: int, y_top: int) -> Tuple[int, int]:
+    """Return the draw origin that right-aligns *text*'s ink box on *x_right*."""
+
+    l, t, r, _ = _measure(text, font)
+    return x_right - (r - l), y_top - t
+
+
+# (label, text x, bbox top) for each column header; static for the process.
+COLUMN_HEADER_METRICS = _column_header_metrics()
+
+
+def _split_logo(logo: Image.Image) -> _LogoBitmap:
+    rgba = logo.convert("RGBA")
+    return rgba.convert("RGB"), rgba.getchannel("A")
+
+
 def _load_logo_for_height(
-    abbr: str, height: int, cache: Dict[str, Optional[Image.Image]]
-) -> Optional[Image.Image]:
+    abbr: str,
+    height: int,
+    cache: Dict[str, Any],
+    prepare: Optional[Callable[[Image.Image], Any]] = None,
+) -> Any:
     key = (abbr or "").strip()
     if not key:
         return None
@@ -143,6 +268,8 @@ def _load_logo_for_height(
             except Exception as exc:  # pragma: no cover - defensive guard
                 logging.debug("NFL logo load failed for %s: %s", candidate, exc)
                 logo = None
+            if logo is not None and prepare is not None:
+                logo = prepare(logo)
             cache[cache_key] = logo
             return logo
 
@@ -150,14 +277,30 @@ def _load_logo_for_height(
     return None
 
 
-def _load_logo_cached(abbr: str) -> Optional[Image.Image]:
-    return _load_logo_for_height(abbr, LOGO_HEIGHT, _LOGO_CACHE)
+def _load_logo_cached(abbr: str) -> Optional[_LogoBitmap]:
+    return _load_logo_for_height(abbr, LOGO_HEIGHT, _LOGO_CACHE, _split_logo)
 
 
 def _load_overview_logo(abbr: str) -> Optional[Image.Image]:
     return _load_logo_for_height(abbr, OVERVIEW_LOGO_HEIGHT, _OVERVIEW_LOGO_CACHE)
 
 
+def _prefetch_overview_logos(division_order: List[str], standings: Dict[str, TeamRows]) -> None:
+    """Decode any uncached overview logos in parallel before the animation starts."""
+
+    missing = {
+        abbr.strip().upper()
+        for division in division_order
+        for abbr in standings.get(division, _EMPTY_ROWS).abbrs
+        if abbr and abbr.strip() and abbr.strip().upper() not in _OVERVIEW_LOGO_CACHE
+    }
+    if not missing:
+        return
+    # PNG inflate and resampling release the GIL, so the decodes overlap.
+    with ThreadPoolExecutor(max_workers=min(8, len(missing))) as pool:
+        list(pool.map(_load_overview_logo, missing))
+
+
 def _normalize_int(value: Any) -> int:
     try:
         if value is None:
@@ -225,6 +368,25 @@ def _extract_division_from_text(text: Any) -> str:
     return f"{conference.upper()} {direction.title()}"
 
 
+def _division_sort_key(item: dict) -> tuple:
+    return (
+        item.get("order", 999),
+        -item.get("wins", 0),
+        item.get("losses", 0),
+        -item.get("ties", 0),
+        item.get("abbr", ""),
+    )
+
+
+_ORDER_KEY = itemgetter("order")
+
+
+def _sort_division(teams: List[dict], ranked: bool) -> None:
+    """Sort *teams* in place, skipping tiebreaks when every rank was supplied."""
+
+    teams.sort(key=_ORDER_KEY if ranked else _division_sort_key)
+
+
 def _target_season_year(today: Optional[datetime.date] = None) -> int:
     today = today or datetime.datetime.now().date()
     if today.month >= 8:
@@ -234,6 +396,7 @@ def _target_season_year(today: Optional[datetime.date] = None) -> int:
 
 def _build_standings_from_rows(rows: Iterable[dict], *, conference_key: str) -> Dict[str, List[dict]]:
     divisions: Dict[str, List[dict]] = {}
+    ranked = True
     for row in rows:
         division = _normalize_division(row.get("division"), conference_key)
         if not division:
@@ -249,47 +412,56 @@ def _build_standings_from_rows(rows: Iterable[dict], *, conference_key: str) ->
         order = _normalize_int(row.get("div_rank"))
 
         bucket = divisions.setdefault(division, [])
+        if order <= 0:
+            ranked = False
+            order = len(bucket) + 1
         entry = {
             "abbr": abbr,
             "wins": wins,
             "losses": losses,
             "ties": ties,
-            "order": order if order > 0 else len(bucket) + 1,
+            "order": order,
         }
         bucket.append(entry)
 
     for teams in divisions.values():
-        teams.sort(
-            key=lambda item: (
-                item.get("order", 999),
-                -item.get("wins", 0),
-                item.get("losses", 0),
-                -item.get("ties", 0),
-                item.get("abbr", ""),
-            )
-        )
+        _sort_division(teams, ranked)
 
     return divisions
 
 
 def _parse_csv_standings(text: str, season: int) -> Tuple[dict[str, dict[str, List[dict]]], Optional[int]]:
-    reader = csv.DictReader(io.StringIO(text))
-    rows = [row for row in reader if row]
-
     standings: dict[str, dict[str, List[dict]]] = {
         CONFERENCE_NFC_KEY: {},
         CONFERENCE_AFC_KEY: {},
     }
 
+    reader = csv.reader(io.StringIO(text))
+    header = next(reader, None)
+    if not header or "season" not in header:
+        return standings, None
+    season_idx = header.index("season")
+
+    # Single pass: keep only rows for the target season or the one before it.
+    buckets: Dict[int, List[List[str]]] = {season: [], season - 1: []}
+    for row in reader:
+        if len(row) <= season_idx:
+            continue
+        bucket = buckets.get(_normalize_int(row[season_idx]))
+        if bucket is None:
+            continue
+        bucket.append(row)
+
     used_season: Optional[int] = None
     for candidate in (season, season - 1):
-        filtered = [row for row in rows if _normalize_int(row.get("season")) == candidate]
+        filtered = buckets[candidate]
         if not filtered:
             continue
 
         used_season = candidate
         grouped: Dict[str, List[dict]] = {CONFERENCE_NFC_KEY: [], CONFERENCE_AFC_KEY: []}
-        for row in filtered:
+        for values in filtered:
+            row = dict(zip(header, values))
             conference = (row.get("conf") or "").strip().upper()
             if conference not in standings:
                 continue
@@ -457,6 +629,7 @@ def _extract_team_info(entry: Any) -> Optional[Dict[str, Any]]:
 
 def _collect_division_groups(data: Any) -> List[Tuple[str, str, List[dict]]]:
     groups: List[Tuple[str, str, List[dict]]] = []
+    containers = _CONTAINER_TYPES
     stack: List[Any] = [data]
     seen_nodes: set[int] = set()
     while stack:
@@ -555,11 +728,11 @@ def _collect_division_groups(data: Any) -> List[Tuple[str, str, List[dict]]]:
 
                         groups.append((conference_hint or "", group_label or "", group_entries))
 
-                stack.extend(value for value in standings.values() if isinstance(value, (dict, list)))
+                stack += [value for value in standings.values() if value.__class__ in containers]
 
-            stack.extend(value for value in node.values() if isinstance(value, (dict, list)))
+            stack += [value for value in node.values() if value.__class__ in containers]
         elif isinstance(node, list):
-            stack.extend(item for item in node if isinstance(item, (dict, list)))
+            stack += [item for item in node if item.__class__ in containers]
     return groups
 
 
@@ -605,6 +778,7 @@ def _find_all_team_entries(payload: Any) -> List[dict]:
     """Return every dict that looks like a standings entry within *payload*."""
 
     entries: List[dict] = []
+    containers = _CONTAINER_TYPES
     stack: List[Any] = [payload]
     while stack:
         node = stack.pop()
@@ -614,9 +788,9 @@ def _find_all_team_entries(payload: Any) -> List[dict]:
             if isinstance(team, dict) and isinstance(stats, list):
                 entries.append(node)
 
-            stack.extend(value for value in node.values() if isinstance(value, (dict, list)))
+            stack += [value for value in node.values() if value.__class__ in containers]
         elif isinstance(node, list):
-            stack.extend(item for item in node if isinstance(item, (dict, list)))
+            stack += [item for item in node if item.__class__ in containers]
 
     return entries
 
@@ -629,6 +803,7 @@ def _parse_standings(data: Any) -> dict[str, dict[str, List[dict]]]:
 
     groups = _collect_division_groups(data)
     added_from_groups = False
+    ranked = True
     if groups:
         for conference_hint, label, entries in groups:
             for entry in entries:
@@ -654,7 +829,10 @@ def _parse_standings(data: Any) -> dict[str, dict[str, List[dict]]]:
 
                 conference_bucket = standings[conference_name]
                 division_bucket = conference_bucket.setdefault(division, [])
-                order = info["rank"] if info["rank"] > 0 else len(division_bucket) + 1
+                order = info["rank"]
+                if order <= 0:
+                    ranked = False
+                    order = len(division_bucket) + 1
                 division_bucket.append(
                     {
                         "abbr": info["abbr"],
@@ -699,11 +877,14 @@ def _parse_standings(data: Any) -> dict[str, dict[str, List[dict]]]:
 
             conference_bucket = standings[conference_name]
             division_bucket = conference_bucket.setdefault(division, [])
-            order = info["rank"] if info["rank"] > 0 else len(division_bucket) + 1
             key = (conference_name, division, info["abbr"])
             if key in seen:
                 continue
             seen.add(key)
+            order = info["rank"]
+            if order <= 0:
+                ranked = False
+                order = len(division_bucket) + 1
             division_bucket.append(
                 {
                     "abbr": info["abbr"],
@@ -716,16 +897,8 @@ def _parse_standings(data: Any) -> dict[str, dict[str, List[dict]]]:
 
     # Sort each division by rank fallback to record
     for conference in standings.values():
-        for division, teams in conference.items():
-            teams.sort(
-                key=lambda item: (
-                    item.get("order", 999),
-                    -item.get("wins", 0),
-                    item.get("losses", 0),
-                    -item.get("ties", 0),
-                    item.get("abbr", ""),
-                )
-            )
+        for teams in conference.values():
+            _sort_division(teams, ranked)
 
     return standings
 
@@ -737,11 +910,11 @@ def _in_offseason(today: Optional[datetime.date] = None) -> bool:
     return start <= today < end
 
 
-def _fetch_standings_data() -> Tuple[dict[str, dict[str, List[dict]]], Optional[str]]:
+def _fetch_standings_data() -> Tuple[dict[str, dict[str, TeamRows]], Optional[str]]:
     now = time.time()
-    cached = _STANDINGS_CACHE.get("data")
-    timestamp = float(_STANDINGS_CACHE.get("timestamp", 0.0))
-    cached_message = _STANDINGS_CACHE.get("message")
+    cached = _STANDINGS_CACHE.data
+    timestamp = _STANDINGS_CACHE.timestamp
+    cached_message = _STANDINGS_CACHE.message
     if cached and now - timestamp < CACHE_TTL:
         return cached, cached_message  # type: ignore[return-value]
 
@@ -750,9 +923,9 @@ def _fetch_standings_data() -> Tuple[dict[str, dict[str, List[dict]]], Optional[
             CONFERENCE_NFC_KEY: {},
             CONFERENCE_AFC_KEY: {},
         }
-        _STANDINGS_CACHE["data"] = standings
-        _STANDINGS_CACHE["timestamp"] = now
-        _STANDINGS_CACHE["message"] = FALLBACK_MESSAGE_OFFSEASON
+        _STANDINGS_CACHE.data = standings
+        _STANDINGS_CACHE.timestamp = now
+        _STANDINGS_CACHE.message = FALLBACK_MESSAGE_OFFSEASON
         logging.info("NFL standings offseason fallback engaged; suppressing data display")
         return standings, FALLBACK_MESSAGE_OFFSEASON
 
@@ -763,36 +936,43 @@ def _fetch_standings_data() -> Tuple[dict[str, dict[str, List[dict]]], Optional[
     except Exception as exc:  # pragma: no cover - network guard
         logging.error("Failed to fetch NFL standings: %s", exc)
         if isinstance(cached, dict):
-            _STANDINGS_CACHE["timestamp"] = now
-            _STANDINGS_CACHE["message"] = cached_message or FALLBACK_MESSAGE_UNAVAILABLE
-            return cached, _STANDINGS_CACHE["message"]  # type: ignore[return-value]
+            _STANDINGS_CACHE.timestamp = now
+            _STANDINGS_CACHE.message = cached_message or FALLBACK_MESSAGE_UNAVAILABLE
+            return cached, _STANDINGS_CACHE.message
         standings = {
             CONFERENCE_NFC_KEY: {},
             CONFERENCE_AFC_KEY: {},
         }
-        _STANDINGS_CACHE["data"] = standings
-        _STANDINGS_CACHE["timestamp"] = now
-        _STANDINGS_CACHE["message"] = FALLBACK_MESSAGE_UNAVAILABLE
+        _STANDINGS_CACHE.data = standings
+        _STANDINGS_CACHE.timestamp = now
+        _STANDINGS_CACHE.message = FALLBACK_MESSAGE_UNAVAILABLE
         return standings, FALLBACK_MESSAGE_UNAVAILABLE
 
     target_season = _target_season_year()
-    standings, used_season = _parse_csv_standings(payload_text, target_season)
+    parsed, used_season = _parse_csv_standings(payload_text, target_season)
     if used_season and used_season != target_season:
         logging.info(
             "NFL standings using fallback season %s instead of %s",
             used_season,
             target_season,
         )
+    standings = {
+        conference: _freeze_conference(divisions) for conference, divisions in parsed.items()
+    }
 
-    _STANDINGS_CACHE["data"] = standings
-    _STANDINGS_CACHE["timestamp"] = now
+    _STANDINGS_CACHE.data = standings
+    _STANDINGS_CACHE.timestamp = now
     fallback_message = None
     if not any(standings.values()) or used_season is None:
         fallback_message = FALLBACK_MESSAGE_UNAVAILABLE
-    _STANDINGS_CACHE["message"] = fallback_message
+    _STANDINGS_CACHE.message = fallback_message
     return standings, fallback_message
 
 
+def _freeze_conference(conference: Dict[str, List[dict]]) -> Dict[str, TeamRows]:
+    return {division: TeamRows.from_teams(teams) for division, teams in conference.items()}
+
+
 def _division_section_height(team_count: int) -> int:
     height = DIVISION_MARGIN_TOP + DIVISION_TEXT_HEIGHT
     height += COLUMN_ROW_HEIGHT + COLUMN_GAP_BELOW
@@ -802,11 +982,21 @@ def _division_section_height(team_count: int) -> int:
     return height
 
 
-def _render_conference(title: str, division_order: List[str], standings: Dict[str, List[dict]]) -> Image.Image:
-    sections = [
-        _division_section_height(len(standings.get(division, [])))
-        for division in division_order
-    ]
+def _render_conference(title: str, division_order: List[str], standings: Dict[str, TeamRows]) -> Image.Image:
+    """Return the tall conference image, reusing it while the standings are unchanged.
+
+    The returned image is shared between calls and must not be modified.
+    """
+
+    division_rows = tuple(standings.get(division, _EMPTY_ROWS) for division in division_order)
+    return _render_conference_cached(title, tuple(division_order), division_rows)
+
+
+@functools.lru_cache(maxsize=4)
+def _render_conference_cached(
+    title: str, division_order: Tuple[str, ...], division_rows: Tuple[TeamRows, ...]
+) -> Image.Image:
+    sections = [_division_section_height(len(rows)) for rows in division_rows]
     content_height = sum(sections)
     total_height = max(
         HEIGHT,
@@ -815,108 +1005,39 @@ def _render_conference(title: str, division_order: List[str], standings: Dict[st
     img = Image.new("RGB", (WIDTH, total_height), "black")
     draw = ImageDraw.Draw(img)
 
-    # Title
-    try:
-        l, t, r, b = draw.textbbox((0, 0), title, font=TITLE_FONT)
-        tw, th = r - l, b - t
-        tx = (WIDTH - tw) // 2 - l
-        ty = TITLE_MARGIN_TOP - t
-    except Exception:  # pragma: no cover - PIL fallback
-        tw, th = draw.textsize(title, font=TITLE_FONT)
-        tx = (WIDTH - tw) // 2
-        ty = TITLE_MARGIN_TOP
-    draw.text((tx, ty), title, font=TITLE_FONT, fill=WHITE)
+    _draw_centered(draw, title, TITLE_FONT, TITLE_MARGIN_TOP, WHITE)
 
     y = TITLE_MARGIN_TOP + TITLE_TEXT_HEIGHT + TITLE_MARGIN_BOTTOM
+    team_x = COLUMN_LAYOUT["team"]
+    wins_x, losses_x, ties_x = COLUMN_LAYOUT["wins"], COLUMN_LAYOUT["losses"], COLUMN_LAYOUT["ties"]
 
-    for division, section_height in zip(division_order, sections):
-        teams = standings.get(division, [])
-
-        # Division header
-        try:
-            l, t, r, b = draw.textbbox((0, 0), division, font=DIVISION_FONT)
-            tw, th = r - l, b - t
-            tx = (WIDTH - tw) // 2 - l
-            ty = y + DIVISION_MARGIN_TOP - t
-        except Exception:  # pragma: no cover - PIL fallback
-            tw, th = draw.textsize(division, font=DIVISION_FONT)
-            tx = (WIDTH - tw) // 2
-            ty = y + DIVISION_MARGIN_TOP
-        draw.text((tx, ty), division, font=DIVISION_FONT, fill=WHITE)
+    for division, rows, section_height in zip(division_order, division_rows, sections):
+        _draw_centered(draw, division, DIVISION_FONT, y + DIVISION_MARGIN_TOP, WHITE)
 
         y_division_bottom = y + section_height
         row_y = y + DIVISION_MARGIN_TOP + DIVISION_TEXT_HEIGHT + COLUMN_GAP_BELOW
 
         # Column headers
         column_y = row_y
-        for label, key, align in COLUMN_HEADERS:
-            x = COLUMN_LAYOUT[key]
-            if align == "right":
-                try:
-                    l, t, r, b = draw.textbbox((0, 0), label, font=COLUMN_FONT)
-                    tw, th = r - l, b - t
-                    tx = x - tw
-                    ty = column_y - t
-                except Exception:  # pragma: no cover - PIL fallback
-                    tw, th = draw.textsize(label, font=COLUMN_FONT)
-                    tx = x - tw
-                    ty = column_y
-            else:
-                try:
-                    l, t, r, b = draw.textbbox((0, 0), label, font=COLUMN_FONT)
-                    tx = x - l
-                    ty = column_y - t
-                except Exception:  # pragma: no cover - PIL fallback
-                    tx = x
-                    ty = column_y
-            draw.text((tx, ty), label, font=COLUMN_FONT, fill=WHITE)
+        for label, tx, t in COLUMN_HEADER_METRICS:
+            draw.text((tx, column_y - t), label, font=COLUMN_FONT, fill=WHITE)
         row_y += COLUMN_ROW_HEIGHT + ROW_SPACING
 
         # Team rows
-        for team in teams:
-            abbr = team.get("abbr", "")
-            wins = str(team.get("wins", 0))
-            losses = str(team.get("losses", 0))
-            ties = str(team.get("ties", 0))
-
-            # Abbreviation
+        for abbr, wins, losses, ties in zip(rows.abbrs, rows.wins_str, rows.losses_str, rows.ties_str):
             text_top = row_y + ROW_PADDING
-            text_center = text_top
-            try:
-                l, t, r, b = draw.textbbox((0, 0), abbr, font=ROW_FONT)
-                tw, th = r - l, b - t
-                tx = COLUMN_LAYOUT["team"] - l
-                ty = row_y + ROW_PADDING - t
-                text_top = ty
-                text_center = text_top + th / 2
-            except Exception:  # pragma: no cover - PIL fallback
-                tw, th = draw.textsize(abbr, font=ROW_FONT)
-                tx = COLUMN_LAYOUT["team"]
-                ty = row_y + ROW_PADDING
-                text_top = ty
-                text_center = text_top + th / 2
-
-            # Logo
+            abbr_pos = _pos_left(abbr, ROW_FONT, team_x, text_top)
+
             logo = _load_logo_cached(abbr)
             if logo:
-                logo_y = int(text_center - logo.height / 2)
-                img.paste(logo, (LEFT_MARGIN, logo_y), logo)
-
-            draw.text((tx, ty), abbr, font=ROW_FONT, fill=WHITE)
-
-            # Record columns
-            for value, key in ((wins, "wins"), (losses, "losses"), (ties, "ties")):
-                x = COLUMN_LAYOUT[key]
-                try:
-                    l, t, r, b = draw.textbbox((0, 0), value, font=ROW_FONT)
-                    tw, th = r - l, b - t
-                    tx = x - tw
-                    ty = row_y + ROW_PADDING - t
-                except Exception:  # pragma: no cover - PIL fallback
-                    tw, th = draw.textsize(value, font=ROW_FONT)
-                    tx = x - tw
-                    ty = row_y + ROW_PADDING
-                draw.text((tx, ty), value, font=ROW_FONT, fill=WHITE)
+                bitmap, mask = logo
+                text_center = abbr_pos[1] + _text_size(abbr, ROW_FONT)[1] / 2
+                img.paste(bitmap, (LEFT_MARGIN, int(text_center - bitmap.height / 2)), mask)
+
+            draw.text(abbr_pos, abbr, font=ROW_FONT, fill=WHITE)
+            draw.text(_pos_right(wins, ROW_FONT, wins_x, text_top), wins, font=ROW_FONT, fill=WHITE)
+            draw.text(_pos_right(losses, ROW_FONT, losses_x, text_top), losses, font=ROW_FONT, fill=WHITE)
+            draw.text(_pos_right(ties, ROW_FONT, ties_x, text_top), ties, font=ROW_FONT, fill=WHITE)
 
             row_y += ROW_HEIGHT + ROW_SPACING
 
@@ -926,20 +1047,19 @@ def _render_conference(title: str, division_order: List[str], standings: Dict[st
 
 
 def _overview_header_frame(title: str) -> Tuple[Image.Image, int]:
-    img = Image.new("RGB", (WIDTH, HEIGHT), "black")
+    img = Image.new("L", (WIDTH, HEIGHT), 0)
     draw = ImageDraw.Draw(img)
-    try:
-        l, t, r, b = draw.textbbox((0, 0), title, font=TITLE_FONT)
-        tw, th = r - l, b - t
-        tx = (WIDTH - tw) // 2 - l
-        ty = TITLE_MARGIN_TOP - t
-    except Exception:  # pragma: no cover - PIL fallback
-        tw, th = draw.textsize(title, font=TITLE_FONT)
-        tx = (WIDTH - tw) // 2
-        ty = TITLE_MARGIN_TOP
-    draw.text((tx, ty), title, font=TITLE_FONT, fill=WHITE)
+    _draw_centered(draw, title, TITLE_FONT, TITLE_MARGIN_TOP, MONO_WHITE)
     content_top = TITLE_MARGIN_TOP + TITLE_TEXT_HEIGHT + TITLE_MARGIN_BOTTOM
-    return img, content_top
+    return img.convert("RGB"), content_top
+
+
+# Paint order: lower logos first so higher ranks overlap them, Bears on top.
+_PLACEMENT_SORT_KEY = itemgetter("sort_key")
+
+
+def _overview_sort_key(abbr: str, y: int) -> Tuple[int, int]:
+    return (1 if abbr.upper() == "CHI" else 0, -y)
 
 
 def _paste_overview_logos(canvas: Image.Image, placements: Iterable[Dict[str, Any]]):
@@ -949,33 +1069,47 @@ def _paste_overview_logos(canvas: Image.Image, placements: Iterable[Dict[str, An
             for placement in placements
             if placement and placement.get("logo") is not None
         ),
-        key=lambda item: (
-            1 if item.get("abbr", "").upper() == "CHI" else 0,
-            -int(item.get("y", 0)),
-        ),
+        key=_PLACEMENT_SORT_KEY,
     )
     for placement in ordered:
-        logo = placement["logo"]
         x = int(placement.get("x", 0))
         y = int(placement.get("y", 0))
-        canvas.paste(logo, (x, y), logo)
+        canvas.paste(placement["logo"], (x, y), placement["mask"])
+
+
+@functools.lru_cache(maxsize=64)
+def _get_resized_overview_logo(abbr: str, width_limit: int) -> Optional[_LogoBitmap]:
+    """Return the overview logo for *abbr* fitted to *width_limit*, ready to paste."""
+
+    logo = _load_overview_logo(abbr)
+    if not logo:
+        return None
+    if width_limit and logo.width > width_limit:
+        ratio = width_limit / float(logo.width)
+        new_size = (
+            max(1, int(logo.width * ratio)),
+            max(1, int(logo.height * ratio)),
+        )
+        logo = logo.resize(new_size, Image.LANCZOS)
+    return _split_logo(logo)
 
 
 def _prepare_overview_columns(
     division_order: List[str],
-    standings: Dict[str, List[dict]],
+    standings: Dict[str, TeamRows],
     content_top: int,
 ) -> Tuple[List[Dict[int, Optional[Dict[str, Any]]]], int]:
     column_count = max(1, len(division_order))
-    column_width = WIDTH / column_count
+    column_width = WIDTH // column_count
+    width_limit = max(0, column_width - 2 * OVERVIEW_COLUMN_MARGIN)
     available_height = max(0, HEIGHT - content_top)
 
     columns: List[Dict[int, Optional[Dict[str, Any]]]] = []
     max_rows = 0
 
     for idx, division in enumerate(division_order):
-        teams = standings.get(division, []) or []
-        team_count = len(teams)
+        abbrs = standings.get(division, _EMPTY_ROWS).abbrs
+        team_count = len(abbrs)
         max_rows = max(max_rows, team_count)
 
         stack_height = (
@@ -987,68 +1121,103 @@ def _prepare_overview_columns(
         if available_height > stack_height:
             top_offset = (available_height - stack_height) // 2
         start_center = content_top + top_offset + OVERVIEW_LOGO_HEIGHT // 2
-        col_center = int((idx + 0.5) * column_width)
-        width_limit = max(0, int(column_width - 2 * OVERVIEW_COLUMN_MARGIN))
-
-        column: Dict[int, Optional[Dict[str, Any]]] = {}
-        for rank, team in enumerate(teams):
-            abbr = team.get("abbr", "")
-            logo_source = _load_overview_logo(abbr)
-            if not logo_source:
-                column[rank] = None
-                continue
+        col_center = (2 * idx + 1) * WIDTH // (2 * column_count)
+
+        column: Dict[int, Optional[Dict[str, Any]]] = dict.fromkeys(range(team_count))
+        loaded = [
+            (rank, abbr, logo)
+            for rank, abbr in enumerate(abbrs)
+            if (logo := _get_resized_overview_logo(abbr, width_limit))
+        ]
+        if loaded:
+            # Integer geometry for the whole column; ``(-n) // 2`` rounds the
+            # half-size up, matching the old truncated ``center - n / 2``.
+            ranks = np.fromiter((item[0] for item in loaded), dtype=np.int64, count=len(loaded))
+            heights = np.fromiter((item[2][0].height for item in loaded), dtype=np.int64, count=len(loaded))
+            widths = np.fromiter((item[2][0].width for item in loaded), dtype=np.int64, count=len(loaded))
+            y_targets = (start_center + ranks * OVERVIEW_VERTICAL_STEP + (-heights) // 2).tolist()
+            x_targets = (col_center + (-widths) // 2).tolist()
+            drop_starts = np.minimum(-heights, content_top - heights - OVERVIEW_DROP_MARGIN).tolist()
+
+            for (rank, abbr, (bitmap, mask)), x_target, y_target, drop_start in zip(
+                loaded, x_targets, y_targets, drop_starts
+            ):
+                column[rank] = {
+                    "logo": bitmap,
+                    "mask": mask,
+                    "x": x_target,
+                    "y": y_target,
+                    "abbr": abbr,
+                    "drop_start": drop_start,
+                    "sort_key": _overview_sort_key(abbr, y_target),
+                }
 
-            logo = logo_source.copy()
-            if width_limit and logo.width > width_limit:
-                ratio = width_limit / float(logo.width)
-                new_size = (
-                    max(1, int(logo.width * ratio)),
-                    max(1, int(logo.height * ratio)),
-                )
-                logo = logo.resize(new_size, Image.LANCZOS)
+        columns.append(column)
 
-            center_y = start_center + rank * OVERVIEW_VERTICAL_STEP
-            y_target = int(center_y - logo.height / 2)
-            x_target = int(col_center - logo.width / 2)
-            drop_start = min(-logo.height, content_top - logo.height - OVERVIEW_DROP_MARGIN)
+    return columns, max_rows
 
-            column[rank] = {
-                "logo": logo,
-                "x": x_target,
-                "y": y_target,
-                "abbr": abbr,
-                "drop_start": drop_start,
-            }
 
-        columns.append(column)
+def _drop_positions(drops: List[Dict[str, Any]], steps: int) -> List[List[int]]:
+    """Return the y of every dropping logo for each animation step."""
 
-    return columns, max_rows
+    starts = np.array([placement["drop_start"] for placement in drops], dtype=np.float64)
+    targets = np.array([placement["y"] for placement in drops], dtype=np.float64)
+    fracs = np.arange(steps, dtype=np.float64) / (steps - 1)
+    ys = np.minimum(starts + (targets - starts) * fracs[:, None], targets)
+    return ys.astype(np.int64).tolist()
+
+
+def _composite_sprites(
+    frame: np.ndarray,
+    sprites: List[Tuple[np.ndarray, np.ndarray, int]],
+    ys: List[int],
+) -> List[Tuple[int, int, int, int]]:
+    """Blend logo pixels into *frame* through their alpha and return the touched boxes.
+
+    Sprites are ``(pixels, alpha, x)`` with ``uint32`` arrays; the blend
+    rounds exactly like ``Image.paste`` with an ``L`` mask.
+    """
+
+    height, width = frame.shape[:2]
+    touched: List[Tuple[int, int, int, int]] = []
+    for (pixels, mask, x), y in zip(sprites, ys):
+        sprite_h, sprite_w = mask.shape[:2]
+        top, bottom = max(0, y), min(height, y + sprite_h)
+        left, right = max(0, x), min(width, x + sprite_w)
+        if bottom <= top or right <= left:
+            continue
+        src = (slice(top - y, bottom - y), slice(left - x, right - x))
+        alpha = mask[src]
+        dst = frame[top:bottom, left:right]
+        blended = dst * (255 - alpha) + pixels[src] * alpha + 128
+        dst[...] = ((blended >> 8) + blended) >> 8
+        touched.append((top, bottom, left, right))
+    return touched
 
 
 def _render_overview(
     display,
     title: str,
     division_order: List[str],
-    standings: Dict[str, List[dict]],
+    standings: Dict[str, TeamRows],
     transition: bool,
     fallback_message: Optional[str],
 ) -> ScreenImage:
     if not any(standings.get(division) for division in division_order):
         return _render_overview_fallback(display, title, fallback_message, transition)
 
+    _prefetch_overview_logos(division_order, standings)
     header, content_top = _overview_header_frame(title)
     columns, max_rows = _prepare_overview_columns(division_order, standings, content_top)
 
     if max_rows == 0:
         return _render_overview_fallback(display, title, fallback_message, transition)
 
+    # Logos that already landed on earlier (lower) ranks, accumulated as the
+    # animation climbs instead of rescanning every column per rank.
+    placed: List[Dict[str, Any]] = []
+    deadline = time.monotonic() + OVERVIEW_FRAME_DELAY
     for rank in range(max_rows - 1, -1, -1):
-        placed: List[Dict[str, Any]] = []
-        for column in columns:
-            for row, placement in column.items():
-                if placement and row > rank:
-                    placed.append(placement)
-
         base = header.copy()
         _paste_overview_logos(base, placed)
 
@@ -1061,30 +1230,32 @@ def _render_overview(
         if not drops:
             continue
 
+        # One working frame per rank: each step restores only the strips the
+        # falling logos covered on the previous step, then composites them
+        # again straight into the pixel array.
+        drops.sort(key=_PLACEMENT_SORT_KEY)
         steps = max(2, OVERVIEW_DROP_STEPS)
-        for step in range(steps):
-            frac = step / (steps - 1)
-            frame = base.copy()
-            animated: List[Dict[str, Any]] = []
-            for placement in drops:
-                start_y = placement["drop_start"]
-                target_y = placement["y"]
-                y_pos = int(start_y + (target_y - start_y) * frac)
-                if y_pos > target_y:
-                    y_pos = target_y
-                animated.append(
-                    {
-                        "logo": placement["logo"],
-                        "x": placement["x"],
-                        "y": y_pos,
-                        "abbr": placement.get("abbr", ""),
-                    }
-                )
-
-            _paste_overview_logos(frame, animated)
-            display.image(frame)
+        ys = _drop_positions(drops, steps)
+        sprites = [
+            (
+                np.asarray(placement["logo"], dtype=np.uint32),
+                np.asarray(placement["mask"], dtype=np.uint32)[..., None],
+                placement["x"],
+            )
+            for placement in drops
+        ]
+        base_px = np.asarray(base)
+        frame = base_px.copy()
+        dirty: List[Tuple[int, int, int, int]] = []
+        for step_ys in ys:
+            for top, bottom, left, right in dirty:
+                frame[top:bottom, left:right] = base_px[top:bottom, left:right]
+            dirty = _composite_sprites(frame, sprites, step_ys)
+            display.image(Image.fromarray(frame))
             display.show()
-            time.sleep(OVERVIEW_FRAME_DELAY)
+            deadline = sleep_until(deadline, OVERVIEW_FRAME_DELAY)
+
+        placed.extend(drops)
 
     final = header.copy()
     all_placements: List[Dict[str, Any]] = []
@@ -1107,32 +1278,15 @@ def _render_overview_fallback(
     transition: bool,
 ) -> ScreenImage:
     clear_display(display)
-    img = Image.new("RGB", (WIDTH, HEIGHT), "black")
+    img = Image.new("L", (WIDTH, HEIGHT), 0)
     draw = ImageDraw.Draw(img)
 
     message = fallback_message or "No standings"
 
-    try:
-        l, t, r, b = draw.textbbox((0, 0), title, font=TITLE_FONT)
-        tw, th = r - l, b - t
-        tx = (WIDTH - tw) // 2 - l
-        ty = 0 - t
-    except Exception:  # pragma: no cover - PIL fallback
-        tw, th = draw.textsize(title, font=TITLE_FONT)
-        tx = (WIDTH - tw) // 2
-        ty = 0
-    draw.text((tx, ty), title, font=TITLE_FONT, fill=WHITE)
-
-    try:
-        l, t, r, b = draw.textbbox((0, 0), message, font=ROW_FONT)
-        tw, th = r - l, b - t
-        mx = (WIDTH - tw) // 2 - l
-        my = (HEIGHT - th) // 2 - t
-    except Exception:  # pragma: no cover - PIL fallback
-        tw, th = draw.textsize(message, font=ROW_FONT)
-        mx = (WIDTH - tw) // 2
-        my = (HEIGHT - th) // 2
-    draw.text((mx, my), message, font=ROW_FONT, fill=WHITE)
+    _draw_centered(draw, title, TITLE_FONT, 0, MONO_WHITE)
+    message_height = _text_size(message, ROW_FONT)[1]
+    _draw_centered(draw, message, ROW_FONT, (HEIGHT - message_height) // 2, MONO_WHITE)
+    img = img.convert("RGB")
 
     if transition:
         return ScreenImage(img, displayed=False)
@@ -1150,62 +1304,19 @@ def _scroll_display(display, full_img: Image.Image):
         time.sleep(SCROLL_PAUSE_BOTTOM)
         return
 
-    max_offset = full_img.height - HEIGHT
-    frame = full_img.crop((0, 0, WIDTH, HEIGHT))
-    display.image(frame)
-    display.show()
-    time.sleep(SCROLL_PAUSE_TOP)
-
-    for offset in range(SCROLL_STEP, max_offset + 1, SCROLL_STEP):
-        frame = full_img.crop((0, offset, WIDTH, offset + HEIGHT))
-        display.image(frame)
-        display.show()
-        time.sleep(SCROLL_DELAY)
-
-    time.sleep(SCROLL_PAUSE_BOTTOM)
+    scroll_vertical(display, full_img, SCROLL_STEP, SCROLL_DELAY, SCROLL_PAUSE_TOP, SCROLL_PAUSE_BOTTOM)
 
 
 def _render_and_display(
     display,
     title: str,
     division_order: List[str],
-    standings: Dict[str, List[dict]],
+    standings: Dict[str, TeamRows],
     transition: bool,
     fallback_message: Optional[str] = None,
 ) -> ScreenImage:
     if not any(standings.values()):
-        clear_display(display)
-        img = Image.new("RGB", (WIDTH, HEIGHT), "black")
-        draw = ImageDraw.Draw(img)
-        message = fallback_message or "No standings"
-        try:
-            l, t, r, b = draw.textbbox((0, 0), title, font=TITLE_FONT)
-            tw, th = r - l, b - t
-            tx = (WIDTH - tw) // 2 - l
-            ty = 0 - t
-        except Exception:  # pragma: no cover - PIL fallback
-            tw, th = draw.textsize(title, font=TITLE_FONT)
-            tx = (WIDTH - tw) // 2
-            ty = 0
-        draw.text((tx, ty), title, font=TITLE_FONT, fill=WHITE)
-
-        try:
-            l, t, r, b = draw.textbbox((0, 0), message, font=ROW_FONT)
-            tw, th = r - l, b - t
-            tx = (WIDTH - tw) // 2 - l
-            ty = (HEIGHT - th) // 2 - t
-        except Exception:  # pragma: no cover - PIL fallback
-            tw, th = draw.textsize(message, font=ROW_FONT)
-            tx = (WIDTH - tw) // 2
-            ty = (HEIGHT - th) // 2
-        draw.text((tx, ty), message, font=ROW_FONT, fill=WHITE)
-
-        if transition:
-            return ScreenImage(img, displayed=False)
-        display.image(img)
-        display.show()
-        time.sleep(SCROLL_PAUSE_BOTTOM)
-        return ScreenImage(img, displayed=True)
+        return _render_overview_fallback(display, title, fallback_message, transition)
 
     full_img = _render_conference(title, division_order, standings)
     if transition:
@@ -36,6 +36,7 @@ from utils import (
     clone_font,
     load_team_logo,
     log_call,
+    scroll_vertical,
 )
 from services.http_client import NHL_HEADERS, get_session
 
@@ -947,19 +948,7 @@ def _scroll_display(display, full_img: Image.Image):
         display.show()
         return
 
-    max_offset = full_img.height - HEIGHT
-    frame = full_img.crop((0, 0, WIDTH, HEIGHT))
-    display.image(frame)
-    display.show()
-    time.sleep(SCROLL_PAUSE_TOP)
-
-    for offset in range(SCROLL_STEP, max_offset + 1, SCROLL_STEP):
-        frame = full_img.crop((0, offset, WIDTH, offset + HEIGHT))
-        display.image(frame)
-        display.show()
-        time.sleep(SCROLL_DELAY)
-
-    time.sleep(SCROLL_PAUSE_BOTTOM)
+    scroll_vertical(display, full_img, SCROLL_STEP, SCROLL_DELAY, SCROLL_PAUSE_TOP, SCROLL_PAUSE_BOTTOM)
 
 
 # ─── Public API ───────────────────────────────────────────────────────────────
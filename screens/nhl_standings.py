@@ -3,13 +3,20 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
 import os
 import socket
+import threading
 import time
 from collections.abc import Iterable
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 from config import (
@@ -19,8 +26,8 @@ from config import (
     FONT_STATUS,
     NHL_IMAGES_DIR,
 )
-from services.http_client import NHL_HEADERS, get_session
-from utils import ScreenImage, clear_display, clone_font, log_call
+from services.http_client import NHL_HEADERS, decode_json, get_session
+from utils import ScreenImage, changed_band, clear_display, clone_font, log_call, scroll_vertical
 
 # ─── Constants ────────────────────────────────────────────────────────────────
 TITLE_WEST = "Western Conference"
@@ -30,6 +37,12 @@ API_WEB_STANDINGS_URL = "https://api-web.nhle.com/v1/standings/now"
 API_WEB_STANDINGS_PARAMS = {"site": "en_nhl"}
 REQUEST_TIMEOUT = 10
 CACHE_TTL = 15 * 60  # seconds
+REFRESH_AHEAD = 0.9  # start refreshing once this fraction of CACHE_TTL has passed
+CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "oled",
+    "nhl_standings.json",
+)
 
 CONFERENCE_WEST_KEY = "Western"
 CONFERENCE_EAST_KEY = "Eastern"
@@ -70,23 +83,114 @@ OVERVIEW_MIN_LOGO_HEIGHT = 18
 OVERVIEW_MAX_LOGO_HEIGHT = 36
 OVERVIEW_LOGO_PADDING = 4
 OVERVIEW_LOGO_OVERLAP = 6
+OVERVIEW_TOP_LAYER_ABBR = "CHI"  # always drawn above overlapping logos
 OVERVIEW_DROP_STEPS = 11
 
 
 WHITE = (255, 255, 255)
+# Text-only frames are drawn on single-channel "L" canvases and converted to
+# RGB once; the panel is an RGB SSD1351 so anything carrying logos stays RGB.
+MONO_WHITE = 255
 
 _SESSION = get_session()
 
 _MEASURE_IMG = Image.new("RGB", (1, 1))
 _MEASURE_DRAW = ImageDraw.Draw(_MEASURE_IMG)
 
-_STANDINGS_CACHE: dict[str, object] = {"timestamp": 0.0, "data": None}
+
+@dataclass(frozen=True)
+class TeamRows:
+    """Column-oriented records for one division, in display order.
+
+    Built once per fetch: the record strings are formatted up front and the
+    instance is hashable, so it doubles as the key for the image caches.
+    """
+
+    abbrs: Tuple[str, ...] = ()
+    wins: Tuple[int, ...] = ()
+    losses: Tuple[int, ...] = ()
+    ot: Tuple[int, ...] = ()
+    points: Tuple[int, ...] = ()
+    wins_str: Tuple[str, ...] = ()
+    losses_str: Tuple[str, ...] = ()
+    ot_str: Tuple[str, ...] = ()
+    points_str: Tuple[str, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.abbrs)
+
+    @classmethod
+    def from_teams(cls, teams: Iterable[dict]) -> "TeamRows":
+        abbrs: List[str] = []
+        wins: List[int] = []
+        losses: List[int] = []
+        ot: List[int] = []
+        points: List[int] = []
+        for team in teams:
+            abbrs.append(team.get("abbr", ""))
+            wins.append(team.get("wins", 0))
+            losses.append(team.get("losses", 0))
+            ot.append(team.get("ot", 0))
+            points.append(team.get("points", 0))
+        return cls(
+            abbrs=tuple(abbrs),
+            wins=tuple(wins),
+            losses=tuple(losses),
+            ot=tuple(ot),
+            points=tuple(points),
+            wins_str=tuple(str(value) for value in wins),
+            losses_str=tuple(str(value) for value in losses),
+            ot_str=tuple(str(value) for value in ot),
+            points_str=tuple(str(value) for value in points),
+        )
+
+    def as_teams(self) -> List[dict]:
+        return [
+            {"abbr": abbr, "wins": w, "losses": l, "ot": ot, "points": pts}
+            for abbr, w, l, ot, pts in zip(self.abbrs, self.wins, self.losses, self.ot, self.points)
+        ]
+
+
+_EMPTY_ROWS = TeamRows()
+Standings = Dict[str, Dict[str, TeamRows]]
+
+# ``source``/``etag``/``last_modified`` describe the response the cached data
+# came from, so the next refresh can be a conditional GET.
+_STANDINGS_CACHE: dict[str, object] = {
+    "timestamp": 0.0,
+    "data": None,
+    "source": None,
+    "etag": None,
+    "last_modified": None,
+}
+# The copy persisted at CACHE_PATH is read on the first cold fetch, not at import.
+_persisted_loaded = False
+# Overview logos are cached pre-split into an RGB bitmap and its alpha mask so
+# pastes never have to derive the mask again. Row logos always land on empty
+# black, so they are cached already composited onto black and pasted without
+# a mask.
+_LogoBitmap = Tuple[Image.Image, Image.Image]
 _LOGO_CACHE: dict[str, Optional[Image.Image]] = {}
-_OVERVIEW_LOGO_CACHE: dict[tuple[str, int], Optional[Image.Image]] = {}
+_OVERVIEW_LOGO_CACHE: dict[tuple[str, int], Optional[_LogoBitmap]] = {}
+# Rendered division sections keyed by title and row values; cleared whenever
+# fresh standings are stored.
+_SECTION_CACHE: dict[tuple, Image.Image] = {}
+# Prepared overview grids (base, logo placements, final image) keyed by the
+# division labels and team order; cleared alongside _SECTION_CACHE.
+_OVERVIEW_IMG_CACHE: dict[tuple, tuple] = {}
+_OVERVIEW_IMG_CACHE_SIZE = 4
 
 STATSAPI_HOST = "statsapi.web.nhl.com"
+# statsapi has been retired in favour of api-web; it is only tried as a
+# fallback when explicitly enabled.
+_USE_STATSAPI = os.environ.get("NHL_USE_STATSAPI", "").strip().lower() in {"1", "true", "yes", "on"}
 _DNS_RETRY_INTERVAL = 600  # seconds
 _dns_block_until = 0.0
+# A successful lookup is trusted for one CACHE_TTL before probing again.
+_dns_ok_until = 0.0
+
+_refresh_lock = threading.Lock()
+_refresh_thread: Optional[threading.Thread] = None
 
 DIVISION_ORDER_WEST = ["Central", "Pacific"]
 DIVISION_ORDER_EAST = ["Metropolitan", "Atlantic"]
@@ -109,7 +213,10 @@ COLUMN_HEADERS = [
 
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=512)
 def _text_size(text: str, font) -> tuple[int, int]:
+    """Return the ink ``(width, height)`` of *text*, cached per font."""
+
     try:
         l, t, r, b = _MEASURE_DRAW.textbbox((0, 0), text, font=font)
         return r - l, b - t
@@ -117,6 +224,26 @@ def _text_size(text: str, font) -> tuple[int, int]:
         return _MEASURE_DRAW.textsize(text, font)
 
 
+@functools.lru_cache(maxsize=256)
+def _text_stamp(text: str, font) -> tuple[Image.Image, int, int]:
+    """Rasterise *text* once into an ``L`` mask plus its offset from the draw origin.
+
+    Pasting a colour through the mask at ``(x + dx, y + dy)`` gives the same
+    pixels as ``draw.text((x, y), ...)`` for integer coordinates, without a
+    FreeType layout per call.
+    """
+
+    try:
+        l, t, r, b = _MEASURE_DRAW.textbbox((0, 0), text, font=font)
+    except Exception:
+        # Older Pillow: textsize spans from the draw origin, so the stamp does too.
+        l = t = 0
+        r, b = _MEASURE_DRAW.textsize(text, font)
+    stamp = Image.new("L", (max(r - l, 1), max(b - t, 1)), 0)
+    ImageDraw.Draw(stamp).text((-l, -t), text, font=font, fill=255)
+    return stamp, l, t
+
+
 ROW_TEXT_HEIGHT = _text_size("PTS", ROW_FONT)[1]
 ROW_HEIGHT = max(LOGO_HEIGHT, ROW_TEXT_HEIGHT) + ROW_PADDING * 2
 COLUMN_HEADER_FONTS = {"points": COLUMN_FONT_POINTS}
@@ -129,6 +256,51 @@ COLUMN_ROW_HEIGHT = COLUMN_TEXT_HEIGHT + 2
 DIVISION_TEXT_HEIGHT = _text_size("Metropolitan", DIVISION_FONT)[1]
 
 
+def _index_logo_files(directory: str) -> dict[str, str]:
+    """Map upper-cased abbreviations to the logo file stem present on disk.
+
+    Mirrors the old per-team probe order (UPPER, lower, Title) with a single
+    directory listing instead of up to three ``stat`` calls per team.
+    """
+
+    try:
+        stems = {name[:-4] for name in os.listdir(directory) if name.endswith(".png")}
+    except OSError as exc:
+        logging.debug("Could not list NHL logo directory %s: %s", directory, exc)
+        return {}
+
+    files: dict[str, str] = {}
+    for stem in stems:
+        key = stem.upper()
+        if key in files:
+            continue
+        for candidate in (key, key.lower(), key.title()):
+            if candidate in stems:
+                files[key] = candidate
+                break
+    return files
+
+
+_LOGO_FILES = _index_logo_files(LOGO_DIR)
+
+
+def _split_logo(logo: Optional[Image.Image]) -> Optional[_LogoBitmap]:
+    if logo is None:
+        return None
+    rgba = logo.convert("RGBA")
+    return rgba.convert("RGB"), rgba.getchannel("A")
+
+
+def _flatten_logo(logo: Optional[Image.Image]) -> Optional[Image.Image]:
+    split = _split_logo(logo)
+    if split is None:
+        return None
+    bitmap, mask = split
+    flat = Image.new("RGB", bitmap.size, "black")
+    flat.paste(bitmap, (0, 0), mask)
+    return flat
+
+
 def _load_logo_cached(abbr: str) -> Optional[Image.Image]:
     key = (abbr or "").strip()
     if not key:
@@ -137,19 +309,13 @@ def _load_logo_cached(abbr: str) -> Optional[Image.Image]:
     if cache_key in _LOGO_CACHE:
         return _LOGO_CACHE[cache_key]
 
-    candidates = [cache_key, cache_key.lower(), cache_key.title()]
-    for candidate in candidates:
-        path = os.path.join(LOGO_DIR, f"{candidate}.png")
-        if os.path.exists(path):
-            logo = _load_logo(candidate)
-            _LOGO_CACHE[cache_key] = logo
-            return logo
-
-    _LOGO_CACHE[cache_key] = None
-    return None
+    name = _LOGO_FILES.get(cache_key)
+    logo = _flatten_logo(_load_logo(name)) if name else None
+    _LOGO_CACHE[cache_key] = logo
+    return logo
 
 
-def _load_overview_logo(abbr: str, height: int) -> Optional[Image.Image]:
+def _load_overview_logo(abbr: str, height: int) -> Optional[_LogoBitmap]:
     abbr_key = (abbr or "").strip().upper()
     if not abbr_key or height <= 0:
         return None
@@ -158,15 +324,17 @@ def _load_overview_logo(abbr: str, height: int) -> Optional[Image.Image]:
     if cache_key in _OVERVIEW_LOGO_CACHE:
         return _OVERVIEW_LOGO_CACHE[cache_key]
 
-    try:
-        from utils import load_team_logo
+    name = _LOGO_FILES.get(abbr_key)
+    logo = None
+    if name:
+        try:
+            from utils import load_team_logo
 
-        logo = load_team_logo(LOGO_DIR, abbr_key, height=height)
-    except Exception as exc:  # pragma: no cover - defensive guard
-        logging.debug("NHL overview logo load failed for %s@%s: %s", abbr_key, height, exc)
-        logo = None
+            logo = load_team_logo(LOGO_DIR, name, height=height)
+        except Exception as exc:  # pragma: no cover - defensive guard
+            logging.debug("NHL overview logo load failed for %s@%s: %s", abbr_key, height, exc)
 
-    _OVERVIEW_LOGO_CACHE[cache_key] = logo
+    _OVERVIEW_LOGO_CACHE[cache_key] = logo = _split_logo(logo)
     return logo
 
 
@@ -198,16 +366,15 @@ def _normalize_int(value) -> int:
         return 0
 
 
-def _division_sort_key(team: dict) -> tuple[int, int, int, int, str]:
-    points = _normalize_int(team.get("points"))
-    wins = _normalize_int(team.get("wins"))
-    ot = _normalize_int(team.get("ot"))
-    rank = _normalize_int(team.get("_rank", 99)) or 99
-    abbr = str(team.get("abbr", ""))
+def _division_sort_key(abbr: str, wins: int, ot: int, points: int, rank: int) -> tuple[int, int, int, int, str]:
     # Sort by points (desc), wins (desc), overtime losses (asc), then fallback rank and abbr.
     return (-points, -wins, ot, rank, abbr)
 
 
+# Parsers store the precomputed key on each team so sorting is a C lookup.
+_SORT_KEY = itemgetter("_sortkey")
+
+
 def _normalize_conference_name(name: object) -> str:
     if not isinstance(name, str):
         return ""
@@ -246,48 +413,162 @@ def _division_section_height(team_count: int) -> int:
     return height
 
 
-def _walk_nodes(payload: object) -> Iterable[dict]:
-    """Yield every mapping from *payload* using an iterative DFS."""
+def _fetch_standings_data() -> Standings:
+    """Return the cached standings, refreshing them off the render path.
 
-    stack: list[object] = [payload]
-    while stack:
-        current = stack.pop()
-        if isinstance(current, dict):
-            yield current
-            stack.extend(current.values())
-        elif isinstance(current, list):
-            stack.extend(current)
+    Only a cold start (nothing cached or persisted) waits on the network;
+    otherwise data nearing ``CACHE_TTL`` is served as-is while a background
+    thread fetches the replacement.
+    """
 
+    global _persisted_loaded
 
-def _fetch_standings_data() -> dict[str, dict[str, list[dict]]]:
-    now = time.time()
     cached = _STANDINGS_CACHE.get("data")
-    timestamp = float(_STANDINGS_CACHE.get("timestamp", 0.0))
-    if cached and now - timestamp < CACHE_TTL:
+    if not cached and not _persisted_loaded:
+        _persisted_loaded = True
+        _load_persisted_standings()
+        cached = _STANDINGS_CACHE.get("data")
+    if cached:
+        timestamp = float(_STANDINGS_CACHE.get("timestamp", 0.0))
+        if time.time() - timestamp >= CACHE_TTL * REFRESH_AHEAD:
+            _start_background_refresh()
         return cached  # type: ignore[return-value]
 
-    standings: Optional[dict[str, dict[str, list[dict]]]] = None
+    return _refresh_standings() or {}
 
-    if _statsapi_available():
-        standings = _fetch_standings_statsapi()
-    else:
-        logging.info("Using api-web NHL standings endpoint (statsapi DNS failure)")
 
-    if not standings:
-        standings = _fetch_standings_api_web()
+def _start_background_refresh() -> None:
+    global _refresh_thread
+
+    with _refresh_lock:
+        if _refresh_thread is not None and _refresh_thread.is_alive():
+            return
+        _refresh_thread = threading.Thread(target=_refresh_standings, name="nhl-standings-refresh", daemon=True)
+        _refresh_thread.start()
+
+
+def _refresh_standings() -> Optional[Standings]:
+    now = time.time()
+    cached = _STANDINGS_CACHE.get("data")
+    validators = _validators()
+    standings = _fetch_standings_api_web()
+
+    if not standings and _USE_STATSAPI and _statsapi_available():
+        standings = _fetch_standings_statsapi()
 
     if standings:
-        _STANDINGS_CACHE["timestamp"] = now
+        # Swap the data in before dropping cached sections so a render running
+        # alongside the refresh thread cannot re-cache the old tables.
         _STANDINGS_CACHE["data"] = standings
+        _STANDINGS_CACHE["timestamp"] = now
+        if standings is not cached:
+            _SECTION_CACHE.clear()
+            _OVERVIEW_IMG_CACHE.clear()
+            _render_conference_cached.cache_clear()
+        # A 304 or byte-identical body only moves the timestamp; the file on
+        # disk is rewritten when the data or its validators changed.
+        if standings is not cached or _validators() != validators:
+            _persist_standings()
         return standings
 
-    return cached or {}
+    return None
+
+
+def _validators() -> tuple:
+    return tuple(_STANDINGS_CACHE.get(key) for key in ("source", "etag", "last_modified", "digest"))
+
+
+def _get_standings(url: str, **kwargs: Any):
+    """GET *url*, revalidating the cached standings when they came from it."""
+
+    headers = dict(NHL_HEADERS)
+    if _STANDINGS_CACHE.get("data") and _STANDINGS_CACHE.get("source") == url:
+        etag = _STANDINGS_CACHE.get("etag")
+        last_modified = _STANDINGS_CACHE.get("last_modified")
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    return _SESSION.get(url, timeout=REQUEST_TIMEOUT, headers=headers, **kwargs)
+
+
+def _remember_validators(url: str, response, digest: str) -> None:
+    _STANDINGS_CACHE["source"] = url
+    _STANDINGS_CACHE["etag"] = response.headers.get("ETag")
+    _STANDINGS_CACHE["last_modified"] = response.headers.get("Last-Modified")
+    _STANDINGS_CACHE["digest"] = digest
+
+
+def _payload_digest(response) -> str:
+    return hashlib.blake2b(response.content, digest_size=16).hexdigest()
+
+
+def _is_cached_payload(url: str, digest: str) -> bool:
+    """Whether a 200 response body is byte-identical to the cached standings' source.
+
+    Covers servers that ignore the conditional headers: the body is hashed and
+    an unchanged feed skips decoding and parsing just like a 304.
+    """
+
+    return bool(
+        _STANDINGS_CACHE.get("data")
+        and _STANDINGS_CACHE.get("source") == url
+        and _STANDINGS_CACHE.get("digest") == digest
+    )
+
+
+def _persist_standings() -> None:
+    """Write the cached standings to disk so a restart can reuse them."""
+
+    tmp_path = f"{CACHE_PATH}.tmp"
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(_STANDINGS_CACHE, fh, default=_encode_rows)
+        os.replace(tmp_path, CACHE_PATH)
+    except Exception as exc:
+        logging.debug("Could not persist NHL standings cache: %s", exc)
+
+
+def _encode_rows(value: object) -> object:
+    # Rows are stored as the team dicts they were built from.
+    if isinstance(value, TeamRows):
+        return value.as_teams()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _load_persisted_standings() -> None:
+    """Seed the in-memory cache from the last standings written to disk."""
+
+    try:
+        with open(CACHE_PATH, encoding="utf-8") as fh:
+            saved = json.load(fh)
+        timestamp = float(saved["timestamp"])
+        data = saved["data"]
+        data = {
+            conference: {division: TeamRows.from_teams(teams) for division, teams in divisions.items()}
+            for conference, divisions in data.items()
+        }
+    except FileNotFoundError:
+        return
+    except Exception as exc:
+        logging.debug("Ignoring unreadable NHL standings cache: %s", exc)
+        return
+
+    if data:
+        _STANDINGS_CACHE["timestamp"] = timestamp
+        _STANDINGS_CACHE["data"] = data
+        for key in ("source", "etag", "last_modified", "digest"):
+            value = saved.get(key)
+            _STANDINGS_CACHE[key] = value if isinstance(value, str) else None
 
 
 def _statsapi_available() -> bool:
-    global _dns_block_until
+    global _dns_block_until, _dns_ok_until
 
     now = time.time()
+    if now < _dns_ok_until:
+        return True
     if now < _dns_block_until:
         return False
 
@@ -301,22 +582,29 @@ def _statsapi_available() -> bool:
         logging.debug("Unexpected error checking NHL statsapi DNS: %s", exc)
     else:
         _dns_block_until = 0.0
+        _dns_ok_until = now + CACHE_TTL
         return True
 
     return True
 
 
-def _fetch_standings_statsapi() -> Optional[dict[str, dict[str, list[dict]]]]:
+def _fetch_standings_statsapi() -> Optional[Standings]:
     try:
-        response = _SESSION.get(STANDINGS_URL, timeout=REQUEST_TIMEOUT, headers=NHL_HEADERS)
+        response = _get_standings(STANDINGS_URL)
+        if response.status_code == 304:
+            return _STANDINGS_CACHE["data"]  # type: ignore[return-value]
         response.raise_for_status()
-        payload = response.json()
+        digest = _payload_digest(response)
+        if _is_cached_payload(STANDINGS_URL, digest):
+            _remember_validators(STANDINGS_URL, response, digest)
+            return _STANDINGS_CACHE["data"]  # type: ignore[return-value]
+        payload = decode_json(response)
     except Exception as exc:
-        logging.error("Failed to fetch NHL standings: %s", exc)
+        logging.error("Failed to fetch NHL standings (statsapi): %s", exc)
         return None
 
     records = payload.get("records", []) if isinstance(payload, dict) else []
-    conferences: dict[str, dict[str, list[dict]]] = {}
+    conferences: Standings = {}
     for record in records:
         if not isinstance(record, dict):
             continue
@@ -344,9 +632,85 @@ def _fetch_standings_statsapi() -> Optional[dict[str, dict[str, list[dict]]]]:
                 }
             )
         if parsed:
-            conferences.setdefault(conf_name, {})[div_name] = parsed
+            conferences.setdefault(conf_name, {})[div_name] = TeamRows.from_teams(parsed)
+
+    if not conferences:
+        return None
+
+    _remember_validators(STANDINGS_URL, response, digest)
+    return conferences
+
+
+@dataclass(frozen=True)
+class RowSchema:
+    """Candidate keys for the fields of one team row, tried in order.
 
-    return conferences if conferences else None
+    ``team_keys`` name the nested team object consulted when a field is not
+    on the row itself.
+    """
+
+    team_keys: Tuple[str, ...]
+    conference_keys: Tuple[str, ...] = ("conferenceName", "conference", "conferenceAbbrev", "conferenceId")
+    team_conference_keys: Tuple[str, ...] = ("conferenceName", "conference")
+    division_keys: Tuple[str, ...] = ("divisionName", "division", "divisionAbbrev", "divisionId")
+    team_division_keys: Tuple[str, ...] = ("divisionName", "division")
+    abbr_keys: Tuple[str, ...] = ("teamAbbrev", "abbrev", "triCode", "teamTricode")
+    team_abbr_keys: Tuple[str, ...] = ("abbrev", "triCode", "teamTricode")
+
+
+# Rows listed under a group carry their team object under "team"; rows found by
+# the generic walk may use any of the wrappers seen across feed versions.
+_GROUPED_ROW_SCHEMA = RowSchema(team_keys=("team",))
+_GENERIC_ROW_SCHEMA = RowSchema(
+    team_keys=("team", "teamRecord", "club", "clubInfo", "teamData", "teams"),
+    abbr_keys=("teamAbbrev", "abbrev", "triCode", "teamTricode", "teamTriCode"),
+    team_abbr_keys=("teamAbbrev", "abbrev", "triCode", "teamTricode", "teamTriCode"),
+)
+
+
+def _parse_team_row(row: dict, schema: RowSchema) -> Optional[tuple[str, str, dict]]:
+    """Return ``(conference, division, entry)`` when *row* is a team row."""
+
+    team_info: dict = {}
+    for key in schema.team_keys:
+        candidate = row.get(key)
+        if isinstance(candidate, dict) and candidate:
+            team_info = candidate
+            break
+
+    conference_name = _normalize_conference_name(
+        _extract_from_candidates(row, schema.conference_keys)
+        or _extract_from_candidates(team_info, schema.team_conference_keys)
+    )
+    division_name = _normalize_division_name(
+        _extract_from_candidates(row, schema.division_keys)
+        or _extract_from_candidates(team_info, schema.team_division_keys)
+    )
+    if not conference_name or not division_name or division_name not in VALID_DIVISIONS:
+        return None
+
+    abbr = (
+        _extract_from_candidates(row, schema.abbr_keys)
+        or _extract_from_candidates(team_info, schema.team_abbr_keys)
+        or _team_abbreviation(team_info)
+    )
+    if not abbr:
+        return None
+
+    wins = _extract_stat(row, _WINS_STAT)
+    losses = _extract_stat(row, _LOSSES_STAT)
+    ot = _extract_stat(row, _OT_STAT)
+    points = _extract_stat(row, _POINTS_STAT)
+
+    entry = {
+        "abbr": abbr,
+        "wins": wins,
+        "losses": losses,
+        "ot": ot,
+        "points": points,
+        "_sortkey": _division_sort_key(abbr, wins, ot, points, _extract_rank(row)),
+    }
+    return conference_name, division_name, entry
 
 
 def _parse_grouped_standings(groups: Iterable[dict]) -> dict[str, dict[str, list[dict]]]:
@@ -367,103 +731,69 @@ def _parse_grouped_standings(groups: Iterable[dict]) -> dict[str, dict[str, list
         for row in rows:
             if not isinstance(row, dict):
                 continue
-            team_info = row.get("team") if isinstance(row.get("team"), dict) else {}
-            conference_name = (
-                _extract_from_candidates(row, ("conferenceName", "conference", "conferenceAbbrev", "conferenceId"))
-                or _extract_from_candidates(team_info, ("conferenceName", "conference"))
-            )
-            division_name = (
-                _extract_from_candidates(row, ("divisionName", "division", "divisionAbbrev", "divisionId"))
-                or _extract_from_candidates(team_info, ("divisionName", "division"))
-            )
-            conference_name = _normalize_conference_name(conference_name)
-            division_name = _normalize_division_name(division_name)
-            if not conference_name or not division_name or division_name not in VALID_DIVISIONS:
-                continue
-
-            abbr = (
-                _extract_from_candidates(row, ("teamAbbrev", "abbrev", "triCode", "teamTricode"))
-                or _extract_from_candidates(team_info, ("abbrev", "triCode", "teamTricode"))
-                or _team_abbreviation(team_info)
-            )
-
-            if not abbr:
+            parsed = _parse_team_row(row, _GROUPED_ROW_SCHEMA)
+            if parsed is None:
                 continue
-
-            wins = _extract_stat(row, ("wins", "w"))
-            losses = _extract_stat(row, ("losses", "l"))
-            ot = _extract_stat(row, ("ot", "otLosses", "otl"))
-            points = _extract_stat(row, ("points", "pts"))
-
-            team_entry = {
-                "abbr": abbr,
-                "wins": wins,
-                "losses": losses,
-                "ot": ot,
-                "points": points,
-                "_rank": _extract_rank(row),
-            }
-
+            conference_name, division_name, entry = parsed
             divisions = conferences.setdefault(conference_name, {})
-            divisions.setdefault(division_name, []).append(team_entry)
+            divisions.setdefault(division_name, []).append(entry)
 
     return conferences
 
 
+# A node can only yield a team when it carries an abbreviation itself or a
+# nested team object to take one from; everything else is skipped unread.
+_TEAM_MARKERS = frozenset(
+    {
+        "teamAbbrev",
+        "abbrev",
+        "triCode",
+        "teamTricode",
+        "teamTriCode",
+        "team",
+        "teamRecord",
+        "club",
+        "clubInfo",
+        "teamData",
+        "teams",
+    }
+)
+
+
 def _parse_generic_standings(payload: object) -> dict[str, dict[str, list[dict]]]:
     conferences: dict[str, dict[str, list[dict]]] = {}
     seen: set[tuple[str, str, str]] = set()
 
-    for node in _walk_nodes(payload):
-        team_info = {}
-        for key in ("team", "teamRecord", "club", "clubInfo", "teamData"):
-            candidate = node.get(key)
-            if isinstance(candidate, dict):
-                team_info = candidate
-                break
-        if not team_info and isinstance(node.get("teams"), dict):
-            team_info = node.get("teams", {})  # type: ignore[assignment]
-
-        conference_name = (
-            _extract_from_candidates(node, ("conferenceName", "conference", "conferenceAbbrev", "conferenceId"))
-            or _extract_from_candidates(team_info, ("conferenceName", "conference"))
-        )
-        division_name = (
-            _extract_from_candidates(node, ("divisionName", "division", "divisionAbbrev", "divisionId"))
-            or _extract_from_candidates(team_info, ("divisionName", "division"))
-        )
-        conference_name = _normalize_conference_name(conference_name)
-        division_name = _normalize_division_name(division_name)
-        if not conference_name or not division_name or division_name not in VALID_DIVISIONS:
+    # Iterative DFS over the payload. Decoded JSON only ever holds plain dicts
+    # and lists, so exact type checks are safe and the hot names are bound
+    # locally. A node recognised as a team row is not descended into: its
+    # nested name/logo/streak mappings can never be team rows themselves.
+    stack: list[object] = [payload]
+    pop = stack.pop
+    extend = stack.extend
+    dict_type = dict
+    list_type = list
+    while stack:
+        current = pop()
+        kind = type(current)
+        if kind is list_type:
+            extend(current)
             continue
-
-        abbr = (
-            _extract_from_candidates(node, ("teamAbbrev", "abbrev", "triCode", "teamTricode", "teamTriCode"))
-            or _extract_from_candidates(team_info, ("teamAbbrev", "abbrev", "triCode", "teamTricode", "teamTriCode"))
-            or _team_abbreviation(team_info)
-        )
-        if not abbr:
+        if kind is not dict_type:
+            continue
+        row = None
+        if not current.keys().isdisjoint(_TEAM_MARKERS):
+            row = _parse_team_row(current, _GENERIC_ROW_SCHEMA)
+        if row is None:
+            extend(current.values())
             continue
 
-        wins = _extract_stat(node, ("wins", "w"))
-        losses = _extract_stat(node, ("losses", "l"))
-        ot = _extract_stat(node, ("ot", "otLosses", "otl"))
-        points = _extract_stat(node, ("points", "pts"))
-
-        key = (conference_name, division_name, abbr)
+        conference_name, division_name, entry = row
+        key = (conference_name, division_name, entry["abbr"])
         if key in seen:
             continue
         seen.add(key)
 
-        entry = {
-            "abbr": abbr,
-            "wins": wins,
-            "losses": losses,
-            "ot": ot,
-            "points": points,
-            "_rank": _extract_rank(node),
-        }
-
         conference = conferences.setdefault(conference_name, {})
         conference.setdefault(division_name, []).append(entry)
 
@@ -494,11 +824,17 @@ def _extract_from_candidates(payload: dict, keys: Iterable[str]) -> str:
     return ""
 
 
+_COERCE_NESTED_KEYS = ("value", "default", "amount", "num", "number", "statValue")
+
+
 def _coerce_int(value: Any) -> Optional[int]:
+    # Exact type checks first: almost every stat in the feeds is a plain int.
+    if type(value) is int:
+        return value
     if isinstance(value, (int, float)):
         try:
             return int(value)
-        except Exception:
+        except (OverflowError, ValueError):
             return None
     if isinstance(value, str):
         text = value.strip()
@@ -509,43 +845,52 @@ def _coerce_int(value: Any) -> Optional[int]:
         except ValueError:
             return None
     if isinstance(value, dict):
-        for key in ("value", "default", "amount", "num", "number", "statValue"):
-            nested = value.get(key)
-            result = _coerce_int(nested)
+        for key in _COERCE_NESTED_KEYS:
+            result = _coerce_int(value.get(key))
             if result is not None:
                 return result
     return None
 
 
-def _extract_stat(row: dict, names: Iterable[str]) -> int:
-    name_candidates = [name.lower() for name in names]
+StatSpec = Tuple[Tuple[str, ...], FrozenSet[str]]
+
+
+def _stat_spec(*keys: str) -> StatSpec:
+    """Pair the row keys for a stat with the set of its lower-cased stat-list names."""
+
+    return keys, frozenset(key.lower() for key in keys)
+
+
+_WINS_STAT = _stat_spec("wins", "w")
+_LOSSES_STAT = _stat_spec("losses", "l")
+_OT_STAT = _stat_spec("ot", "otLosses", "otl")
+_POINTS_STAT = _stat_spec("points", "pts")
+_STATS_CONTAINER_KEYS = ("stats", "teamStats", "teamStatsLeaders", "splits")
+
+
+def _extract_stat(row: dict, spec: StatSpec) -> int:
+    names, name_set = spec
     for key in names:
         value = row.get(key)
         result = _coerce_int(value)
         if result is not None:
             return result
 
-    stats_iterables = [
-        row.get("stats"),
-        row.get("teamStats"),
-        row.get("teamStatsLeaders"),
-        row.get("splits"),
-    ]
-    for stats in stats_iterables:
+    for container_key in _STATS_CONTAINER_KEYS:
+        stats = row.get(container_key)
         if not isinstance(stats, Iterable) or isinstance(stats, (str, bytes)):
             continue
         for stat in stats:
             if not isinstance(stat, dict):
                 continue
             identifier = _coerce_text(stat.get("name")) or _coerce_text(stat.get("type"))
-            abbreviation = _coerce_text(stat.get("abbr") or stat.get("abbreviation"))
-            identifier = identifier.lower() if identifier else ""
-            abbreviation = abbreviation.lower() if abbreviation else ""
-            for candidate in name_candidates:
-                if identifier == candidate or abbreviation == candidate:
-                    result = _coerce_int(stat.get("value") or stat.get("statValue") or stat.get("amount"))
-                    if result is not None:
-                        return result
+            if identifier.lower() not in name_set:
+                abbreviation = _coerce_text(stat.get("abbr") or stat.get("abbreviation"))
+                if abbreviation.lower() not in name_set:
+                    continue
+            result = _coerce_int(stat.get("value") or stat.get("statValue") or stat.get("amount"))
+            if result is not None:
+                return result
     return 0
 
 
@@ -565,20 +910,7 @@ def _extract_rank(row: dict) -> int:
     return 99
 
 
-def _fetch_standings_api_web() -> Optional[dict[str, dict[str, list[dict]]]]:
-    try:
-        response = _SESSION.get(
-            API_WEB_STANDINGS_URL,
-            timeout=REQUEST_TIMEOUT,
-            headers=NHL_HEADERS,
-            params=API_WEB_STANDINGS_PARAMS,
-        )
-        response.raise_for_status()
-        payload = response.json()
-    except Exception as exc:
-        logging.error("Failed to fetch NHL standings (api-web fallback): %s", exc)
-        return None
-
+def _parse_listed_groups(payload: object) -> dict[str, dict[str, list[dict]]]:
     standings_payload: list = []
     if isinstance(payload, dict):
         for key in ("standings", "records", "groups"):
@@ -591,41 +923,86 @@ def _fetch_standings_api_web() -> Optional[dict[str, dict[str, list[dict]]]]:
                 standings_payload = [payload]
     elif isinstance(payload, list):
         standings_payload = payload
+    return _parse_grouped_standings(standings_payload)
 
-    conferences = _parse_grouped_standings(standings_payload)
 
-    if not conferences and isinstance(payload, dict):
-        alternative_groups: list = []
-        for key in (
-            "standingsByConference",
-            "standingsByDivision",
-            "standingsByType",
-            "divisionStandings",
-        ):
-            value = payload.get(key)
-            if isinstance(value, list):
-                alternative_groups.extend(value)
-        if alternative_groups:
-            conferences = _parse_grouped_standings(alternative_groups)
+def _parse_alternative_groups(payload: object) -> dict[str, dict[str, list[dict]]]:
+    if not isinstance(payload, dict):
+        return {}
+    alternative_groups: list = []
+    for key in (
+        "standingsByConference",
+        "standingsByDivision",
+        "standingsByType",
+        "divisionStandings",
+    ):
+        value = payload.get(key)
+        if isinstance(value, list):
+            alternative_groups.extend(value)
+    return _parse_grouped_standings(alternative_groups) if alternative_groups else {}
+
+
+# Tried in order until one yields standings; the winner is remembered so later
+# refreshes of the same feed go straight to it.
+_API_WEB_PARSERS = {
+    "grouped": _parse_listed_groups,
+    "alternative": _parse_alternative_groups,
+    "generic": _parse_generic_standings,
+}
+_PARSER_CHOICE: dict[str, str] = {}
 
-    if not conferences:
-        conferences = _parse_generic_standings(payload)
+
+def _parse_api_web_payload(payload: object) -> dict[str, dict[str, list[dict]]]:
+    choice = _PARSER_CHOICE.get(API_WEB_STANDINGS_URL)
+    if choice:
+        conferences = _API_WEB_PARSERS[choice](payload)
+        if conferences:
+            return conferences
+
+    for name, parser in _API_WEB_PARSERS.items():
+        if name == choice:
+            continue
+        conferences = parser(payload)
+        if conferences:
+            _PARSER_CHOICE[API_WEB_STANDINGS_URL] = name
+            return conferences
+    return {}
+
+
+def _fetch_standings_api_web() -> Optional[Standings]:
+    try:
+        response = _get_standings(API_WEB_STANDINGS_URL, params=API_WEB_STANDINGS_PARAMS)
+        if response.status_code == 304:
+            return _STANDINGS_CACHE["data"]  # type: ignore[return-value]
+        response.raise_for_status()
+        digest = _payload_digest(response)
+        if _is_cached_payload(API_WEB_STANDINGS_URL, digest):
+            _remember_validators(API_WEB_STANDINGS_URL, response, digest)
+            return _STANDINGS_CACHE["data"]  # type: ignore[return-value]
+        payload = decode_json(response)
+    except Exception as exc:
+        logging.error("Failed to fetch NHL standings (api-web): %s", exc)
+        return None
+
+    conferences = _parse_api_web_payload(payload)
 
     if not conferences:
         return None
 
-    for conference in conferences.values():
-        for teams in conference.values():
-            teams.sort(key=_division_sort_key)
-            for item in teams:
-                item.pop("_rank", None)
+    standings: Standings = {}
+    for conference_name, conference in conferences.items():
+        frozen = standings[conference_name] = {}
+        for division_name, teams in conference.items():
+            teams.sort(key=_SORT_KEY)
+            frozen[division_name] = TeamRows.from_teams(teams)
 
-    return conferences
+    _remember_validators(API_WEB_STANDINGS_URL, response, digest)
+    return standings
 
 
-def _draw_centered_text(draw: ImageDraw.ImageDraw, text: str, font, top: int) -> int:
+def _draw_centered_text(draw: ImageDraw.ImageDraw, text: str, font, top: int, fill=WHITE) -> int:
     tw, th = _text_size(text, font)
-    draw.text(((WIDTH - tw) // 2, top), text, font=font, fill=WHITE)
+    draw.text(((WIDTH - tw) // 2, top), text, font=font, fill=fill)
     return th
 
 
@@ -640,7 +1017,7 @@ def _draw_text(draw: ImageDraw.ImageDraw, text: str, font, x: int, top: int, hei
         draw.text((x, y), text, font=font, fill=WHITE)
 
 
-def _draw_division(img: Image.Image, draw: ImageDraw.ImageDraw, top: int, title: str, teams: Iterable[dict]) -> int:
+def _draw_division(img: Image.Image, draw: ImageDraw.ImageDraw, top: int, title: str, rows: TeamRows) -> int:
     y = top + DIVISION_MARGIN_TOP
     y += _draw_centered_text(draw, title, DIVISION_FONT, y)
     y += 2
@@ -650,18 +1027,27 @@ def _draw_division(img: Image.Image, draw: ImageDraw.ImageDraw, top: int, title:
         _draw_text(draw, label, font, COLUMN_LAYOUT[key], header_top, COLUMN_ROW_HEIGHT, align)
     y += COLUMN_ROW_HEIGHT + COLUMN_GAP_BELOW
 
-    for team in teams:
-        row_top = y
-        abbr = team.get("abbr", "")
+    # Rows inline _draw_text with the paste method, font and column positions
+    # bound once per section; text goes down as cached stamps.
+    paste = img.paste
+    text_size = _text_size
+    stamp_for = _text_stamp
+    font = ROW_FONT
+    team_x = COLUMN_LAYOUT["team"]
+    stat_xs = (COLUMN_LAYOUT["wins"], COLUMN_LAYOUT["losses"], COLUMN_LAYOUT["ot"], COLUMN_LAYOUT["points"])
+    for abbr, *stats in zip(rows.abbrs, rows.wins_str, rows.losses_str, rows.ot_str, rows.points_str):
         logo = _load_logo_cached(abbr)
         if logo:
-            logo_y = row_top + (ROW_HEIGHT - logo.height) // 2
-            img.paste(logo, (LEFT_MARGIN, logo_y), logo)
-        _draw_text(draw, abbr, ROW_FONT, COLUMN_LAYOUT["team"], row_top, ROW_HEIGHT, "left")
-        _draw_text(draw, str(team.get("wins", "")), ROW_FONT, COLUMN_LAYOUT["wins"], row_top, ROW_HEIGHT, "right")
-        _draw_text(draw, str(team.get("losses", "")), ROW_FONT, COLUMN_LAYOUT["losses"], row_top, ROW_HEIGHT, "right")
-        _draw_text(draw, str(team.get("ot", "")), ROW_FONT, COLUMN_LAYOUT["ot"], row_top, ROW_HEIGHT, "right")
-        _draw_text(draw, str(team.get("points", "")), ROW_FONT, COLUMN_LAYOUT["points"], row_top, ROW_HEIGHT, "right")
+            paste(logo, (LEFT_MARGIN, y + (ROW_HEIGHT - logo.height) // 2))
+        if abbr:
+            th = text_size(abbr, font)[1]
+            stamp, dx, dy = stamp_for(abbr, font)
+            paste(WHITE, (team_x + dx, y + (ROW_HEIGHT - th) // 2 + dy), stamp)
+        for text, x in zip(stats, stat_xs):
+            if text:
+                tw, th = text_size(text, font)
+                stamp, dx, dy = stamp_for(text, font)
+                paste(WHITE, (x - tw + dx, y + (ROW_HEIGHT - th) // 2 + dy), stamp)
         y += ROW_HEIGHT + ROW_SPACING
 
     y -= ROW_SPACING
@@ -669,12 +1055,35 @@ def _draw_division(img: Image.Image, draw: ImageDraw.ImageDraw, top: int, title:
     return y
 
 
-def _render_conference(title: str, division_order: List[str], standings: Dict[str, List[dict]]) -> Image.Image:
+def _build_division_image(title: str, rows: TeamRows) -> Image.Image:
+    # The title gap in _draw_division is not part of the layout height, so
+    # allow for it and trim to where the section actually ends.
+    img = Image.new("RGB", (WIDTH, _division_section_height(len(rows)) + 2), "black")
+    bottom = _draw_division(img, ImageDraw.Draw(img), 0, title, rows)
+    return img.crop((0, 0, WIDTH, bottom))
+
+
+def _division_image_cached(title: str, rows: TeamRows) -> Image.Image:
+    key = (title, rows)
+    section = _SECTION_CACHE.get(key)
+    if section is None:
+        section = _SECTION_CACHE[key] = _build_division_image(title, rows)
+    return section
+
+
+def _render_conference(title: str, division_order: List[str], standings: Dict[str, TeamRows]) -> Image.Image:
+    divisions = tuple((division, standings.get(division, _EMPTY_ROWS)) for division in division_order)
+    return _render_conference_cached(title, divisions)
+
+
+@functools.lru_cache(maxsize=4)
+def _render_conference_cached(title: str, divisions: Tuple[Tuple[str, TeamRows], ...]) -> Image.Image:
+    """Render a conference from its division rows; cleared whenever new standings land."""
+
     total_height = TITLE_MARGIN_TOP + _text_size(title, TITLE_FONT)[1] + TITLE_MARGIN_BOTTOM
-    for idx, division in enumerate(division_order):
-        team_count = len(standings.get(division, []))
-        total_height += _division_section_height(team_count)
-        if idx < len(division_order) - 1:
+    for idx, (_, rows) in enumerate(divisions):
+        total_height += _division_section_height(len(rows))
+        if idx < len(divisions) - 1:
             total_height += SECTION_GAP
     total_height = max(total_height, HEIGHT)
 
@@ -685,34 +1094,36 @@ def _render_conference(title: str, division_order: List[str], standings: Dict[st
     y += _draw_centered_text(draw, title, TITLE_FONT, y)
     y += TITLE_MARGIN_BOTTOM
 
-    for idx, division in enumerate(division_order):
-        teams = standings.get(division, [])
-        if not teams:
+    for idx, (division, rows) in enumerate(divisions):
+        if not rows:
             continue
-        y = _draw_division(img, draw, y, f"{division} Division", teams)
-        if idx < len(division_order) - 1:
+        section = _division_image_cached(f"{division} Division", rows)
+        img.paste(section, (0, y))
+        y += section.height
+        if idx < len(divisions) - 1:
             y += SECTION_GAP
 
     return img
 
 
-Placement = Tuple[str, Image.Image, int, int]
+Placement = Tuple[str, _LogoBitmap, int, int]
 
 
 def _overview_layout(
-    divisions: Sequence[tuple[str, List[dict]]]
+    divisions: Sequence[tuple[str, TeamRows]]
 ) -> tuple[Image.Image, List[float], float, float, int, int]:
-    base = Image.new("RGB", (WIDTH, HEIGHT), "black")
+    base = Image.new("L", (WIDTH, HEIGHT), 0)
     draw = ImageDraw.Draw(base)
 
     y = TITLE_MARGIN_TOP
-    y += _draw_centered_text(draw, OVERVIEW_TITLE, TITLE_FONT, y)
+    y += _draw_centered_text(draw, OVERVIEW_TITLE, TITLE_FONT, y, MONO_WHITE)
     y += OVERVIEW_TITLE_MARGIN_BOTTOM
+    base = base.convert("RGB")
 
     logos_top = y
     available_height = max(1.0, HEIGHT - logos_top - OVERVIEW_BOTTOM_MARGIN)
 
-    max_rows = max((len(teams) for _, teams in divisions), default=0)
+    max_rows = max((len(rows) for _, rows in divisions), default=0)
     if max_rows <= 0:
         max_rows = 1
 
@@ -752,7 +1163,7 @@ def _overview_logo_position(
 
 
 def _build_overview_rows(
-    divisions: Sequence[tuple[str, List[dict]]],
+    divisions: Sequence[tuple[str, TeamRows]],
     col_centers: Sequence[float],
     logos_top: float,
     cell_height: float,
@@ -760,41 +1171,39 @@ def _build_overview_rows(
     max_rows: int,
 ) -> List[List[Placement]]:
     rows: List[List[Placement]] = [[] for _ in range(max_rows)]
+    load_logo = _load_overview_logo
+    position = _overview_logo_position
 
-    for col_idx, (_, teams) in enumerate(divisions):
-        limited = teams[:max_rows]
-        for row_idx, team in enumerate(limited):
-            abbr = (team.get("abbr") or "").upper()
+    for col_idx, (_, division_rows) in enumerate(divisions):
+        for row_idx, abbr in enumerate(division_rows.abbrs[:max_rows]):
+            abbr = abbr.upper()
             if not abbr:
                 continue
-            logo = _load_overview_logo(abbr, logo_height)
+            logo = load_logo(abbr, logo_height)
             if not logo:
                 continue
-            x0, y0 = _overview_logo_position(col_idx, row_idx, col_centers, logos_top, cell_height, logo)
+            x0, y0 = position(col_idx, row_idx, col_centers, logos_top, cell_height, logo[0])
             rows[row_idx].append((abbr, logo, x0, y0))
 
+    # Paint order is z-order: the top-layer team goes last in its row.
+    for row in rows:
+        row.sort(key=_is_top_layer)
     return rows
 
 
-def _ensure_blackhawks_top_layer(canvas: Image.Image, placements: Sequence[Placement]) -> None:
-    for abbr, logo, x0, y0 in placements:
-        if logo and abbr.upper() == "CHI":
-            canvas.paste(logo, (x0, y0), logo)
+def _is_top_layer(placement: Placement) -> bool:
+    return placement[0] == OVERVIEW_TOP_LAYER_ABBR
 
 
 def _compose_overview_image(
     base: Image.Image, row_positions: Sequence[Sequence[Placement]]
 ) -> tuple[Image.Image, List[Placement]]:
+    # Bottom ranks first so higher ranks overlap them, with the top-layer
+    # team deferred to the very end; the sort is stable.
+    placements = sorted((p for row in reversed(row_positions) for p in row), key=_is_top_layer)
     final = base.copy()
-    placements: List[Placement] = []
-
-    for row in reversed(row_positions):
-        for placement in row:
-            abbr, logo, x0, y0 = placement
-            final.paste(logo, (x0, y0), logo)
-            placements.append(placement)
-
-    _ensure_blackhawks_top_layer(final, placements)
+    for abbr, (bitmap, mask), x0, y0 in placements:
+        final.paste(bitmap, (x0, y0), mask)
     return final, placements
 
 
@@ -805,49 +1214,84 @@ def _animate_overview_drop(
     if not has_logos:
         return
 
-    placed: List[Placement] = []
+    # Logos that have landed are composited once into a static layer when
+    # their rank finishes; each step then copies that layer and pastes only
+    # the falling logos. The top-layer team is kept out of the static layer
+    # and pasted last on every frame so it stays above everything else.
+    static = base.copy()
+    top_layer: Optional[Placement] = None
+    # As in _scroll_vertical, displays with a partial window only receive the
+    # rows that changed since the previous frame - the band the falling rank
+    # swept through.
+    push_region = getattr(display, "image_region", None)
+    shown: Optional[np.ndarray] = None
     for rank in range(len(row_positions) - 1, -1, -1):
         drops = row_positions[rank]
         if not drops:
             continue
 
         for step in range(OVERVIEW_DROP_STEPS):
-            frame = base.copy()
-            dynamic: List[Placement] = []
-
-            for abbr, logo, x0, y0 in placed:
-                frame.paste(logo, (x0, y0), logo)
+            frame = static.copy()
+            paste = frame.paste
 
             frac = step / (OVERVIEW_DROP_STEPS - 1) if OVERVIEW_DROP_STEPS > 1 else 1.0
-            for abbr, logo, x0, y_target in drops:
-                start_y = -logo.height
+            for abbr, (bitmap, mask), x0, y_target in drops:
+                start_y = -bitmap.height
                 y_pos = int(start_y + (y_target - start_y) * frac)
                 if y_pos > y_target:
                     y_pos = y_target
-                frame.paste(logo, (x0, y_pos), logo)
-                dynamic.append((abbr, logo, x0, y_pos))
-
-            _ensure_blackhawks_top_layer(frame, [*placed, *dynamic])
-            display.image(frame)
+                paste(bitmap, (x0, y_pos), mask)
+
+            if top_layer is not None:
+                _, (bitmap, mask), x0, y0 = top_layer
+                paste(bitmap, (x0, y0), mask)
+            if push_region is None:
+                display.image(frame)
+            else:
+                pixels = np.asarray(frame)
+                band = (0, HEIGHT) if shown is None else changed_band(pixels, shown)
+                if band is not None:
+                    top, bottom = band
+                    push_region(pixels[top:bottom], (0, top, WIDTH, bottom))
+                shown = pixels
             if hasattr(display, "show"):
                 display.show()
             time.sleep(SCROLL_DELAY)
 
-        placed.extend(drops)
+        for placement in drops:
+            if _is_top_layer(placement):
+                top_layer = placement
+                continue
+            _, (bitmap, mask), x0, y0 = placement
+            static.paste(bitmap, (x0, y0), mask)
 
 
-def _prepare_overview(divisions: List[tuple[str, List[dict]]]) -> tuple[Image.Image, List[List[Placement]]]:
+def _prepare_overview(divisions: List[tuple[str, TeamRows]]) -> tuple[Image.Image, List[List[Placement]]]:
     base, col_centers, logos_top, cell_height, logo_height, max_rows = _overview_layout(divisions)
     row_positions = _build_overview_rows(divisions, col_centers, logos_top, cell_height, logo_height, max_rows)
     return base, row_positions
 
 
+def _overview_cached(
+    divisions: List[tuple[str, TeamRows]]
+) -> tuple[Image.Image, List[List[Placement]], Image.Image]:
+    key = tuple((label, rows.abbrs) for label, rows in divisions)
+    entry = _OVERVIEW_IMG_CACHE.get(key)
+    if entry is None:
+        base, row_positions = _prepare_overview(divisions)
+        final_img, _ = _compose_overview_image(base, row_positions)
+        if len(_OVERVIEW_IMG_CACHE) >= _OVERVIEW_IMG_CACHE_SIZE:
+            _OVERVIEW_IMG_CACHE.clear()
+        entry = _OVERVIEW_IMG_CACHE[key] = (base, row_positions, final_img)
+    return entry
+
+
 def _render_empty(title: str) -> Image.Image:
-    img = Image.new("RGB", (WIDTH, HEIGHT), "black")
+    img = Image.new("L", (WIDTH, HEIGHT), 0)
     draw = ImageDraw.Draw(img)
-    _draw_centered_text(draw, title, TITLE_FONT, 10)
-    _draw_centered_text(draw, "No standings", ROW_FONT, HEIGHT // 2 - ROW_TEXT_HEIGHT // 2)
-    return img
+    _draw_centered_text(draw, title, TITLE_FONT, 10, MONO_WHITE)
+    _draw_centered_text(draw, "No standings", ROW_FONT, HEIGHT // 2 - ROW_TEXT_HEIGHT // 2, MONO_WHITE)
+    return img.convert("RGB")
 
 
 def _scroll_vertical(display, image: Image.Image) -> None:
@@ -856,16 +1300,7 @@ def _scroll_vertical(display, image: Image.Image) -> None:
         time.sleep(SCROLL_PAUSE_BOTTOM)
         return
 
-    max_offset = image.height - HEIGHT
-    display.image(image.crop((0, 0, WIDTH, HEIGHT)))
-    time.sleep(SCROLL_PAUSE_TOP)
-
-    for offset in range(SCROLL_STEP, max_offset + 1, SCROLL_STEP):
-        frame = image.crop((0, offset, WIDTH, offset + HEIGHT))
-        display.image(frame)
-        time.sleep(SCROLL_DELAY)
-
-    time.sleep(SCROLL_PAUSE_BOTTOM)
+    scroll_vertical(display, image, SCROLL_STEP, SCROLL_DELAY, SCROLL_PAUSE_TOP, SCROLL_PAUSE_BOTTOM)
 
 
 # ─── Public API ───────────────────────────────────────────────────────────────
@@ -873,13 +1308,13 @@ def _scroll_vertical(display, image: Image.Image) -> None:
 def draw_nhl_standings_overview(display, transition: bool = False) -> ScreenImage:
     standings_by_conf = _fetch_standings_data()
 
-    divisions: List[tuple[str, List[dict]]] = []
-    for conference_key, division_name, label in OVERVIEW_DIVISIONS:
-        conference = standings_by_conf.get(conference_key, {})
-        teams = conference.get(division_name, [])
-        divisions.append((label, teams))
+    conferences = {key: standings_by_conf.get(key) or {} for key in (CONFERENCE_EAST_KEY, CONFERENCE_WEST_KEY)}
+    divisions: List[tuple[str, TeamRows]] = [
+        (label, conferences[conference_key].get(division_name, _EMPTY_ROWS))
+        for conference_key, division_name, label in OVERVIEW_DIVISIONS
+    ]
 
-    if not any(teams for _, teams in divisions):
+    if not any(rows for _, rows in divisions):
         clear_display(display)
         img = _render_empty(OVERVIEW_TITLE)
         if transition:
@@ -887,8 +1322,7 @@ def draw_nhl_standings_overview(display, transition: bool = False) -> ScreenImag
         display.image(img)
         return ScreenImage(img, displayed=True)
 
-    base, row_positions = _prepare_overview(divisions)
-    final_img, _ = _compose_overview_image(base, row_positions)
+    base, row_positions, final_img = _overview_cached(divisions)
 
     clear_display(display)
     _animate_overview_drop(display, base, row_positions)
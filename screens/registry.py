@@ -2,82 +2,94 @@
 from __future__ import annotations
 
 import datetime as _dt
+import functools
+import importlib
 import logging
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any, Callable, Dict, Optional, Tuple
 
 from PIL import Image
 
 from utils import ScreenImage, animate_scroll
-from screens.draw_bears_schedule import show_bears_next_game
-from screens.draw_bulls_schedule import (
-    draw_bulls_next_home_game,
-    draw_last_bulls_game,
-    draw_live_bulls_game,
-    draw_sports_screen_bulls,
-)
-from screens.draw_hawks_schedule import (
-    draw_hawks_next_home_game,
-    draw_last_hawks_game,
-    draw_live_hawks_game,
-    draw_sports_screen_hawks,
-)
-from screens.draw_inside import draw_inside
-from screens.draw_travel_time import draw_travel_time_screen
-from screens.draw_vrnof import draw_vrnof_screen
-from screens.draw_weather import draw_weather_screen_1, draw_weather_screen_2
-from screens.draw_date_time import draw_date, draw_time
-from screens.mlb_schedule import (
-    draw_box_score,
-    draw_cubs_result,
-    draw_last_game,
-    draw_next_home_game,
-    draw_sports_screen,
-)
-from screens.mlb_scoreboard import draw_mlb_scoreboard
-from screens.mlb_standings import (
-    draw_AL_Central,
-    draw_AL_East,
-    draw_AL_Overview,
-    draw_AL_West,
-    draw_AL_WildCard,
-    draw_NL_Central,
-    draw_NL_East,
-    draw_NL_Overview,
-    draw_NL_West,
-    draw_NL_WildCard,
-)
-from screens.mlb_team_standings import draw_standings_screen1, draw_standings_screen2
-from screens.nba_scoreboard import draw_nba_scoreboard
-from screens.nfl_scoreboard import draw_nfl_scoreboard
-from screens.nfl_standings import (
-    draw_nfl_overview_afc,
-    draw_nfl_overview_nfc,
-    draw_nfl_standings_afc,
-    draw_nfl_standings_nfc,
-)
-from screens.nhl_scoreboard import draw_nhl_scoreboard
-from screens.nhl_standings import (
-    draw_nhl_standings_east,
-    draw_nhl_standings_overview,
-    draw_nhl_standings_west,
-)
+
+
+def _lazy(module: str, name: str) -> Callable[..., Any]:
+    """Return a stand-in for ``screens.<module>.<name>`` imported on first call.
+
+    Screen modules pull in fonts, logos and HTTP sessions at import time, so
+    only the screens that actually render pay that cost.
+    """
+
+    @functools.lru_cache(maxsize=None)
+    def resolve() -> Callable[..., Any]:
+        return getattr(importlib.import_module(f"screens.{module}"), name)
+
+    def call(*args, **kwargs):
+        return resolve()(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    return call
+
+
+show_bears_next_game = _lazy("draw_bears_schedule", "show_bears_next_game")
+draw_bulls_next_home_game = _lazy("draw_bulls_schedule", "draw_bulls_next_home_game")
+draw_last_bulls_game = _lazy("draw_bulls_schedule", "draw_last_bulls_game")
+draw_live_bulls_game = _lazy("draw_bulls_schedule", "draw_live_bulls_game")
+draw_sports_screen_bulls = _lazy("draw_bulls_schedule", "draw_sports_screen_bulls")
+draw_hawks_next_home_game = _lazy("draw_hawks_schedule", "draw_hawks_next_home_game")
+draw_last_hawks_game = _lazy("draw_hawks_schedule", "draw_last_hawks_game")
+draw_live_hawks_game = _lazy("draw_hawks_schedule", "draw_live_hawks_game")
+draw_sports_screen_hawks = _lazy("draw_hawks_schedule", "draw_sports_screen_hawks")
+draw_inside = _lazy("draw_inside", "draw_inside")
+draw_travel_time_screen = _lazy("draw_travel_time", "draw_travel_time_screen")
+draw_vrnof_screen = _lazy("draw_vrnof", "draw_vrnof_screen")
+draw_weather_screen_1 = _lazy("draw_weather", "draw_weather_screen_1")
+draw_weather_screen_2 = _lazy("draw_weather", "draw_weather_screen_2")
+draw_date = _lazy("draw_date_time", "draw_date")
+draw_time = _lazy("draw_date_time", "draw_time")
+draw_box_score = _lazy("mlb_schedule", "draw_box_score")
+draw_cubs_result = _lazy("mlb_schedule", "draw_cubs_result")
+draw_last_game = _lazy("mlb_schedule", "draw_last_game")
+draw_next_home_game = _lazy("mlb_schedule", "draw_next_home_game")
+draw_sports_screen = _lazy("mlb_schedule", "draw_sports_screen")
+draw_mlb_scoreboard = _lazy("mlb_scoreboard", "draw_mlb_scoreboard")
+draw_AL_Central = _lazy("mlb_standings", "draw_AL_Central")
+draw_AL_East = _lazy("mlb_standings", "draw_AL_East")
+draw_AL_Overview = _lazy("mlb_standings", "draw_AL_Overview")
+draw_AL_West = _lazy("mlb_standings", "draw_AL_West")
+draw_AL_WildCard = _lazy("mlb_standings", "draw_AL_WildCard")
+draw_NL_Central = _lazy("mlb_standings", "draw_NL_Central")
+draw_NL_East = _lazy("mlb_standings", "draw_NL_East")
+draw_NL_Overview = _lazy("mlb_standings", "draw_NL_Overview")
+draw_NL_West = _lazy("mlb_standings", "draw_NL_West")
+draw_NL_WildCard = _lazy("mlb_standings", "draw_NL_WildCard")
+draw_standings_screen1 = _lazy("mlb_team_standings", "draw_standings_screen1")
+draw_standings_screen2 = _lazy("mlb_team_standings", "draw_standings_screen2")
+draw_nba_scoreboard = _lazy("nba_scoreboard", "draw_nba_scoreboard")
+draw_nfl_scoreboard = _lazy("nfl_scoreboard", "draw_nfl_scoreboard")
+draw_nfl_overview_afc = _lazy("nfl_standings", "draw_nfl_overview_afc")
+draw_nfl_overview_nfc = _lazy("nfl_standings", "draw_nfl_overview_nfc")
+draw_nfl_standings_afc = _lazy("nfl_standings", "draw_nfl_standings_afc")
+draw_nfl_standings_nfc = _lazy("nfl_standings", "draw_nfl_standings_nfc")
+draw_nhl_scoreboard = _lazy("nhl_scoreboard", "draw_nhl_scoreboard")
+draw_nhl_standings_east = _lazy("nhl_standings", "draw_nhl_standings_east")
+draw_nhl_standings_overview = _lazy("nhl_standings", "draw_nhl_standings_overview")
+draw_nhl_standings_west = _lazy("nhl_standings", "draw_nhl_standings_west")
 
 RenderCallable = Callable[[], Optional[Image.Image | ScreenImage]]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScreenDefinition:
     """Represents one renderable screen."""
 
     id: str
     render: RenderCallable
     available: bool = True
-    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScreenContext:
     """Runtime context required to build screen callables."""
 
@@ -108,32 +120,42 @@ def _extract_team_id(blob):
     return None
 
 
-def _games_match(game_a, game_b):
-    if not game_a or not game_b:
-        return False
+_GAME_ID_KEYS = ("gamePk", "id", "gameId", "gameUUID")
+
 
-    for key in ("gamePk", "id", "gameId", "gameUUID"):
-        a_val = game_a.get(key)
-        b_val = game_b.get(key)
-        if a_val and b_val and a_val == b_val:
-            return True
+def _game_teams(game, prefix):
+    teams = game.get("teams")
+    if isinstance(teams, dict):
+        return teams.get(prefix) or {}
+    return game.get(f"{prefix}Team") or game.get(f"{prefix}_team") or {}
 
-    def _teams(game, prefix):
-        teams = game.get("teams")
-        if isinstance(teams, dict):
-            return teams.get(prefix) or {}
-        return game.get(f"{prefix}Team") or game.get(f"{prefix}_team") or {}
 
-    date_a = (game_a.get("gameDate") or game_a.get("officialDate") or "")[:10]
-    date_b = (game_b.get("gameDate") or game_b.get("officialDate") or "")[:10]
-    if date_a and date_b and date_a == date_b:
-        home_a = _extract_team_id(_teams(game_a, "home"))
-        home_b = _extract_team_id(_teams(game_b, "home"))
-        away_a = _extract_team_id(_teams(game_a, "away"))
-        away_b = _extract_team_id(_teams(game_b, "away"))
-        return home_a and home_a == home_b and away_a and away_a == away_b
+def _game_key(game):
+    """Normalise *game* to ``(ids, date, home_id, away_id)`` for comparisons."""
 
-    return False
+    return (
+        tuple(game.get(key) for key in _GAME_ID_KEYS),
+        (game.get("gameDate") or game.get("officialDate") or "")[:10],
+        _extract_team_id(_game_teams(game, "home")),
+        _extract_team_id(_game_teams(game, "away")),
+    )
+
+
+def _games_match(game_a, game_b):
+    if not game_a or not game_b:
+        return False
+
+    ids_a, date_a, home_a, away_a = _game_key(game_a)
+    ids_b, date_b, home_b, away_b = _game_key(game_b)
+    if any(a_val and a_val == b_val for a_val, b_val in zip(ids_a, ids_b)):
+        return True
+    # Feeds without a shared ID still describe the same game when the date
+    # and both teams line up.
+    return bool(
+        date_a and date_a == date_b
+        and home_a and home_a == home_b
+        and away_a and away_a == away_b
+    )
 
 
 def _format_time(value: Optional[_dt.time]) -> str:
@@ -148,13 +170,8 @@ def build_screen_registry(context: ScreenContext) -> Tuple[Dict[str, ScreenDefin
     registry: Dict[str, ScreenDefinition] = {}
     metadata: Dict[str, Any] = {}
 
-    def register(screen_id: str, func: RenderCallable, available: bool = True, **extra):
-        registry[screen_id] = ScreenDefinition(
-            id=screen_id,
-            render=func,
-            available=available,
-            metadata=extra,
-        )
+    def register(screen_id: str, func: RenderCallable, available: bool = True):
+        registry[screen_id] = ScreenDefinition(id=screen_id, render=func, available=available)
 
     register("date", lambda: draw_date(context.display, transition=False))
     register("time", lambda: draw_time(context.display, transition=True))
@@ -1,7 +1,7 @@
 # screens_catalog.py
 # A single source of truth for all of your possible screen IDs.
 
-SCREEN_IDS = [
+SCREEN_IDS: tuple[str, ...] = (
     "date", "time",
     "weather logo", "weather1", "weather2", "inside",
     "verano logo", "vrnof", "travel",
@@ -14,4 +14,6 @@ SCREEN_IDS = [
     "mlb logo", "MLB Scoreboard",
     "NL Overview", "NL East", "NL Central", "NL West", "NL Wild Card",
     "AL Overview", "AL East", "AL Central", "AL West", "AL Wild Card",
-]
+)
+
+SCREEN_ID_SET: frozenset[str] = frozenset(SCREEN_IDS)
@@ -4,12 +4,20 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any, Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional: faster decoding of JSON feeds
+    orjson = None
+
 DEFAULT_HEADERS: Dict[str, str] = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -35,17 +43,38 @@ _RETRY = Retry(
     raise_on_status=False,
 )
 
+# Screens prefetch standings and scoreboards from several threads at once;
+# keep enough idle connections per host that parallel fetches reuse TLS
+# sessions instead of discarding them when the default pool of 10 overflows.
+_POOL_SIZE = 32
+
 _USE_SYSTEM_PROXIES = (
     os.environ.get("HTTP_CLIENT_USE_SYSTEM_PROXIES", "").strip().lower()
     in {"1", "true", "yes", "on"}
 )
 
+# Validators and decoded bodies of recent request_json(revalidate=True)
+# responses, keyed by the full request URL, so unchanged feeds come back as a
+# bodiless 304.
+_CONDITIONAL_CACHE_SIZE = 64
+_CONDITIONAL_CACHE: "OrderedDict[str, Tuple[Dict[str, str], Any]]" = OrderedDict()
+_CONDITIONAL_LOCK = threading.Lock()
+
+# Payloads served by cached_json without any request until they expire.
+_TTL_CACHE_SIZE = 64
+_TTL_CACHE: Dict[str, Tuple[float, Any]] = {}
+_TTL_LOCK = threading.Lock()
+
 
 def _build_session() -> requests.Session:
     session = requests.Session()
     session.trust_env = _USE_SYSTEM_PROXIES
     session.headers.update(DEFAULT_HEADERS)
-    adapter = HTTPAdapter(max_retries=_RETRY)
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_SIZE,
+        pool_maxsize=_POOL_SIZE,
+        max_retries=_RETRY,
+    )
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     return session
@@ -60,6 +89,14 @@ def get_session() -> requests.Session:
     return _SESSION
 
 
+def decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def request_json(
     url: str,
     *,
@@ -68,16 +105,104 @@ def request_json(
     headers: Optional[Dict[str, str]] = None,
     quiet: bool = False,
     session: Optional[requests.Session] = None,
+    revalidate: bool = False,
     **kwargs: Any,
 ) -> Optional[Dict[str, Any]]:
-    """Perform a GET request that returns JSON, with optional quiet logging."""
+    """Perform a GET request that returns JSON, with optional quiet logging.
+
+    With *revalidate*, responses carrying an ``ETag`` or ``Last-Modified``
+    header are remembered and revalidated on the next call; a ``304`` returns
+    a shallow copy of the remembered payload.
+    """
 
     sess = session or _SESSION
     try:
+        key = cached = None
+        if revalidate:
+            key = requests.Request("GET", url, params=params).prepare().url
+            with _CONDITIONAL_LOCK:
+                cached = _CONDITIONAL_CACHE.get(key)
+        if cached is not None:
+            headers = {**cached[0], **(headers or {})}
         response = sess.get(url, params=params, headers=headers, timeout=timeout, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            with _CONDITIONAL_LOCK:
+                if key in _CONDITIONAL_CACHE:
+                    _CONDITIONAL_CACHE.move_to_end(key)
+            return _copy_payload(cached[1])
         response.raise_for_status()
-        return response.json()
+        payload = decode_json(response)
+        if key is not None:
+            _remember_response(key, response, payload)
+            return _copy_payload(payload)
+        return payload
     except Exception as exc:  # pragma: no cover - defensive network layer
         if not quiet:
             logging.warning("Request failed: %s (%s)", url, exc)
         return None
+
+
+def cached_json(
+    url: str,
+    *,
+    ttl: float,
+    params: Optional[Dict[str, Any]] = None,
+    **kwargs: Any,
+) -> Optional[Dict[str, Any]]:
+    """Like :func:`request_json`, but reuse a successful payload for *ttl* seconds.
+
+    Meant for endpoints that several screens read within one rotation or that
+    rarely change; failures are not cached. A *ttl* of 0 always fetches. Each
+    hit returns a shallow copy, so callers may modify the top level freely.
+    """
+
+    if ttl <= 0:
+        return request_json(url, params=params, **kwargs)
+
+    key = requests.Request("GET", url, params=params).prepare().url
+    now = time.monotonic()
+    with _TTL_LOCK:
+        entry = _TTL_CACHE.get(key)
+    if entry is not None and entry[0] > now:
+        logging.debug("JSON cache hit: %s", key)
+        return _copy_payload(entry[1])
+
+    logging.debug("JSON cache miss: %s", key)
+    payload = request_json(url, params=params, **kwargs)
+    if payload is not None:
+        with _TTL_LOCK:
+            if len(_TTL_CACHE) >= _TTL_CACHE_SIZE:
+                for stale in [k for k, (expires, _) in _TTL_CACHE.items() if expires <= now]:
+                    del _TTL_CACHE[stale]
+                if len(_TTL_CACHE) >= _TTL_CACHE_SIZE:
+                    _TTL_CACHE.clear()
+            _TTL_CACHE[key] = (now + ttl, payload)
+        return _copy_payload(payload)
+    return payload
+
+
+def _copy_payload(payload: Any) -> Any:
+    # Cached payloads are handed out as copies so a caller editing its result
+    # cannot change what the next caller receives.
+    if isinstance(payload, (dict, list)):
+        return payload.copy()
+    return payload
+
+
+def _remember_response(key: str, response: requests.Response, payload: Any) -> None:
+    validators: Dict[str, str] = {}
+    etag = response.headers.get("ETag")
+    if etag:
+        validators["If-None-Match"] = etag
+    last_modified = response.headers.get("Last-Modified")
+    if last_modified:
+        validators["If-Modified-Since"] = last_modified
+
+    with _CONDITIONAL_LOCK:
+        if not validators:
+            _CONDITIONAL_CACHE.pop(key, None)
+            return
+        _CONDITIONAL_CACHE[key] = (validators, payload)
+        _CONDITIONAL_CACHE.move_to_end(key)
+        while len(_CONDITIONAL_CACHE) > _CONDITIONAL_CACHE_SIZE:
+            _CONDITIONAL_CACHE.popitem(last=False)
@@ -3,18 +3,78 @@
 import threading
 import time
 import logging
+import socket
 import subprocess
 import requests
+from requests.adapters import HTTPAdapter
+
+from services.http_client import get_session
+
+try:
+    from pydbus import SystemBus  # type: ignore
+except ImportError:  # optional: in-process SSID lookup through NetworkManager
+    SystemBus = None
 
 CHECK_INTERVAL   = 15    # seconds between checks
+FAST_CHECK_INTERVAL = CHECK_INTERVAL // 4  # seconds between checks after a state change
+FAST_CHECK_CYCLES   = 3   # how many fast checks follow a state change
+MAX_CHECK_INTERVAL  = 60  # cap while the link has stayed "ok"
 INTERNET_TIMEOUT = 3     # seconds for each HTTP HEAD
+SSID_CACHE_TTL   = 300   # seconds an SSID is reused while the link stays "ok"
 
 PRIMARY_CHECK_URL   = "https://api.openweathermap.org"
 SECONDARY_CHECK_URL = "https://www.google.com"
+# Public resolvers tried with a bare TCP connect before any HTTPS probe. The
+# short timeout leaves most of the deadline for HTTPS on networks that drop
+# outbound port 53.
+TCP_CHECK_HOSTS = (("1.1.1.1", 53), ("8.8.8.8", 53))
+TCP_CHECK_TIMEOUT = 1
+
+
+def _build_probe_session():
+    """
+    Keep-alive session for the connectivity probe. Reusing the socket turns a
+    healthy check into one HEAD instead of a fresh TCP + TLS handshake; no
+    retries, so a failed probe is reported straight away.
+    """
+    session = requests.Session()
+    session.trust_env = get_session().trust_env
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
-# Shared state
-wifi_status = "no_wifi"    # one of "no_wifi", "no_internet", "ok"
-current_ssid = None
+_PROBE_SESSION = _build_probe_session()
+
+# Shared state: (status, ssid), republished as one tuple so readers always
+# see a matching pair. status is one of "no_wifi", "no_internet", "ok".
+_state = ("no_wifi", None)
+
+# _wake cuts the current wait short; _stop ends the monitor loop.
+_wake = threading.Event()
+_stop = threading.Event()
+
+
+def get_state():
+    """
+    Return the latest ``(status, ssid)`` pair published by the monitor.
+    """
+    return _state
+
+
+def get_status():
+    """
+    Return the latest status: "no_wifi", "no_internet" or "ok".
+    """
+    return _state[0]
+
+
+def get_ssid():
+    """
+    Return the latest SSID, or None when not associated.
+    """
+    return _state[1]
 
 
 def _get_wireless_interfaces():
@@ -30,13 +90,44 @@ def _get_wireless_interfaces():
         return []
 
 
+def _get_ssid_dbus():
+    """
+    Ask NetworkManager over D-Bus for the SSID of the active Wi-Fi connection.
+    Returns None when pydbus or NetworkManager is unavailable.
+    """
+    if SystemBus is None:
+        return None
+    try:
+        bus = SystemBus()
+        nm = bus.get("org.freedesktop.NetworkManager")
+        for path in nm.ActiveConnections:
+            active = bus.get("org.freedesktop.NetworkManager", path)
+            if active.Type != "802-11-wireless":
+                continue
+            settings = bus.get("org.freedesktop.NetworkManager", active.Connection).GetSettings()
+            raw = settings.get("802-11-wireless", {}).get("ssid")
+            if raw:
+                ssid = bytes(raw).decode("utf-8", "replace")
+                logging.debug(f"_get_ssid: D-Bus reports SSID='{ssid}'")
+                return ssid
+    except Exception as e:
+        logging.debug(f"_get_ssid: D-Bus lookup failed: {e}")
+    return None
+
+
 def _get_ssid():
     """
     Try, in order:
+      0) NetworkManager over D-Bus (no subprocess; needs pydbus)
       1) nmcli
       2) iw dev <iface> link   (for each wireless iface)
       3) iwgetid -r
     """
+    # 0) D-Bus
+    ssid = _get_ssid_dbus()
+    if ssid:
+        return ssid
+
     # 1) nmcli
     try:
         out = subprocess.check_output(
@@ -81,13 +172,54 @@ def _get_ssid():
     return None
 
 
+def _tcp_reachable(host, port, timeout):
+    """
+    True when a TCP connection to host:port opens within `timeout` seconds.
+    """
+    try:
+        socket.create_connection((host, port), timeout=timeout).close()
+        return True
+    except OSError as e:
+        logging.debug(f"_tcp_reachable: {host}:{port} failed: {e}")
+        return False
+
+
 def _check_internet():
     """
-    HTTP HEAD against our primary API, fallback to Google.
+    TCP connect to public DNS resolvers (one round trip, no TLS), then an
+    HTTP HEAD against our primary API with a fallback to Google.
+
+    All probes share one deadline of INTERNET_TIMEOUT * 2, so a stalled probe
+    cannot push the whole check past it.
     """
+    deadline = time.monotonic() + INTERNET_TIMEOUT * 2
+
+    def budget():
+        remaining = deadline - time.monotonic()
+        return min(INTERNET_TIMEOUT, remaining) if remaining > 0.1 else None
+
+    for host, port in TCP_CHECK_HOSTS:
+        timeout = budget()
+        if timeout is None:
+            logging.debug("_check_internet: deadline reached before %s", host)
+            return False
+        if _tcp_reachable(host, port, min(TCP_CHECK_TIMEOUT, timeout)):
+            logging.debug(f"_check_internet: {host}:{port} reachable")
+            return True
+
     for url in (PRIMARY_CHECK_URL, SECONDARY_CHECK_URL):
+        timeout = budget()
+        if timeout is None:
+            logging.debug("_check_internet: deadline reached before %s", url)
+            break
         try:
-            requests.head(url, timeout=INTERNET_TIMEOUT)
+            response = _PROBE_SESSION.head(
+                url,
+                timeout=(timeout, timeout),
+                allow_redirects=False,
+            )
+            # Hand the socket back to the pool for the next probe.
+            response.close()
             logging.debug(f"_check_internet: {url} reachable")
             return True
         except Exception as e:
@@ -95,22 +227,48 @@ def _check_internet():
     return False
 
 
+def _next_interval(state, stable_cycles):
+    """
+    Seconds to wait before the next check. Poll fast right after a state
+    change, back off exponentially while the link stays "ok", and keep the
+    normal cadence during an outage so recovery is noticed promptly.
+    """
+    if stable_cycles < FAST_CHECK_CYCLES:
+        return FAST_CHECK_INTERVAL
+    if state != "ok":
+        return CHECK_INTERVAL
+    backoff = min(stable_cycles - FAST_CHECK_CYCLES, 4)
+    return min(CHECK_INTERVAL * 2 ** backoff, MAX_CHECK_INTERVAL)
+
+
 def _monitor_loop():
     """
-    Continuously update `wifi_status` to one of:
+    Continuously publish `_state`, read through get_state(), as a
+    (status, ssid) tuple where status is one of:
       – "ok"          (internet reachable)
       – "no_internet" (we’re on WLAN but no Internet)
       – "no_wifi"     (not associated to any SSID)
     """
-    global wifi_status, current_ssid
+    global _state
     logging.info("🔌 Wi-Fi monitor thread started")
     last = None
+    ssid_checked = 0.0
+    stable_cycles = 0
 
-    while True:
+    while not _stop.is_set():
+        # Clear before checking, so a force_refresh() that lands during the
+        # check wakes the next wait instead of being dropped.
+        _wake.clear()
         # see if we can reach the Internet
         internet = _check_internet()
-        # then try to detect SSID
-        ssid = _get_ssid()
+        # then try to detect SSID; while the link stays healthy the SSID does
+        # not change, so skip the nmcli/iw subprocesses until it goes stale
+        now = time.monotonic()
+        if internet and last == "ok" and now - ssid_checked < SSID_CACHE_TTL:
+            ssid = _state[1]
+        else:
+            ssid = _get_ssid()
+            ssid_checked = now
 
         if internet:
             state = "ok"
@@ -119,11 +277,12 @@ def _monitor_loop():
         else:
             state = "no_wifi"
 
-        with threading.Lock():
-            wifi_status = state
-            current_ssid = ssid
+        _state = (state, ssid)
 
-        if state != last:
+        if state == last:
+            stable_cycles += 1
+        else:
+            stable_cycles = 0
             if state == "no_wifi":
                 logging.warning("❌ No Wi-Fi connection detected.")
             elif state == "no_internet":
@@ -132,12 +291,29 @@ def _monitor_loop():
                 logging.info(f"✅ Wi-Fi '{ssid}' and Internet OK.")
             last = state
 
-        time.sleep(CHECK_INTERVAL)
+        _wake.wait(_next_interval(state, stable_cycles))
 
 
 def start_monitor():
     """
     Start the background Wi-Fi monitor.
     """
+    _stop.clear()
     t = threading.Thread(target=_monitor_loop, daemon=True)
     t.start()
+    return t
+
+
+def force_refresh():
+    """
+    Run the next check now instead of waiting out the poll interval.
+    """
+    _wake.set()
+
+
+def stop_monitor():
+    """
+    Ask the monitor loop to exit after its current check.
+    """
+    _stop.set()
+    _wake.set()
@@ -0,0 +1,35 @@
+import data_fetch
+
+
+def test_fetch_all_feeds_shapes_results_like_the_screen_cache(monkeypatch):
+    for name in (
+        "fetch_weather",
+        "fetch_blackhawks_last_game",
+        "fetch_blackhawks_live_game",
+        "fetch_blackhawks_next_game",
+        "fetch_blackhawks_next_home_game",
+        "fetch_bulls_last_game",
+        "fetch_bulls_live_game",
+        "fetch_bulls_next_game",
+        "fetch_bulls_next_home_game",
+        "fetch_cubs_standings",
+        "fetch_sox_standings",
+    ):
+        monkeypatch.setattr(data_fetch, name, lambda name=name: name)
+    monkeypatch.setattr(data_fetch, "fetch_cubs_games", lambda: {"last_game": "cubs last"})
+    monkeypatch.setattr(data_fetch, "fetch_sox_games", lambda: None)
+
+    feeds = data_fetch.fetch_all_feeds()
+
+    assert feeds["weather"] == "fetch_weather"
+    assert feeds["hawks"]["next_home"] == "fetch_blackhawks_next_home_game"
+    assert feeds["bulls"]["live"] == "fetch_bulls_live_game"
+    assert feeds["cubs"] == {
+        "stand": "fetch_cubs_standings",
+        "last": "cubs last",
+        "live": None,
+        "next": None,
+        "next_home": None,
+    }
+    assert feeds["sox"]["stand"] == "fetch_sox_standings"
+    assert feeds["sox"]["last"] is None
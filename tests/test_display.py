@@ -0,0 +1,89 @@
+import numpy as np
+from PIL import Image
+
+import utils
+
+
+class _Panel:
+    width = height = 128
+
+    def __init__(self):
+        self.writes = []
+
+    def clear(self):
+        pass
+
+    def ShowImage(self, buf, window=None):
+        self.writes.append((bytes(memoryview(np.ascontiguousarray(buf))), window))
+
+
+def _display():
+    display = utils.Display.__new__(utils.Display)
+    display.disp = _Panel()
+    display.width = display.height = 128
+    display._shadow = None
+    return display
+
+
+def test_image_only_flushes_rows_that_changed():
+    display = _display()
+    frame = Image.new("RGB", (128, 128), "black")
+    display.image(frame)
+    assert display.disp.writes[-1][1] == (0, 0, 127, 127)
+
+    display.image(frame)
+    assert len(display.disp.writes) == 1
+
+    frame.paste((255, 0, 0), (10, 40, 20, 43))
+    display.image(frame)
+    data, window = display.disp.writes[-1]
+    assert window == (0, 40, 127, 42)
+    assert data == utils.pack_rgb565(np.asarray(frame)[40:43]).tobytes()
+
+
+def test_region_pushes_keep_the_shadow_in_sync():
+    display = _display()
+    display.clear()
+    band = np.full((4, 128, 3), 255, dtype=np.uint8)
+    display.image_region(band, (0, 8, 128, 12))
+
+    frame = Image.new("RGB", (128, 128), "black")
+    frame.paste((255, 255, 255), (0, 8, 128, 12))
+    writes = len(display.disp.writes)
+    display.image(frame)
+    assert len(display.disp.writes) == writes
+
+
+def test_scroll_vertical_sends_only_changed_bands(monkeypatch):
+    monkeypatch.setattr(utils.time, "sleep", lambda _s: None)
+    display = _display()
+    display.clear()
+    strip = Image.new("RGB", (128, 160), "black")
+    strip.paste((0, 255, 0), (0, 0, 128, 4))
+    strip.paste((0, 0, 255), (0, 150, 128, 152))
+    utils.scroll_vertical(display, strip, 1, 0.0, 0.0, 0.0)
+
+    # Every write is a row band, never a full repaint after the first frame.
+    for data, (left, top, right, bottom) in display.disp.writes[1:]:
+        assert (left, right) == (0, 127)
+        assert len(data) == (bottom - top + 1) * 128 * 2
+    assert len(display.disp.writes) < 1 + 32
+    final = np.asarray(strip)[32:160]
+    assert display._shadow.tobytes() == utils.pack_rgb565(final).tobytes()
+
+
+def test_scroll_vertical_skips_identical_frames_on_plain_displays(monkeypatch):
+    monkeypatch.setattr(utils.time, "sleep", lambda _s: None)
+    frames = []
+
+    class _Headless:
+        def image(self, img):
+            frames.append(np.asarray(img).copy())
+
+    strip = Image.new("RGB", (128, 140), "black")
+    strip.paste((255, 255, 255), (0, 0, 128, 2))
+    utils.scroll_vertical(_Headless(), strip, 1, 0.0, 0.0, 0.0)
+
+    # Only offsets 1 and 2 move the white rows; the rest are identical.
+    assert len(frames) == 3
+    assert np.array_equal(frames[-1], np.zeros((128, 128, 3), dtype=np.uint8))
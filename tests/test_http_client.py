@@ -33,3 +33,81 @@ def test_http_client_can_opt_in_to_system_proxies(monkeypatch: pytest.MonkeyPatc
         assert session.trust_env is True
     finally:
         _reload_http_client(monkeypatch, None)
+
+
+def test_http_client_pools_connections_for_parallel_fetches():
+    from services import http_client
+
+    adapter = http_client.get_session().get_adapter("https://api-web.nhle.com")
+    assert adapter._pool_maxsize == http_client._POOL_SIZE
+    assert adapter.max_retries is http_client._RETRY
+
+
+class _Session:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, *, params=None, headers=None, **kwargs):
+        self.sent_headers.append(headers)
+        return self.responses.pop(0)
+
+
+def test_request_json_revalidates_with_etag(monkeypatch: pytest.MonkeyPatch, fake_response):
+    from services import http_client
+
+    monkeypatch.setattr(http_client, "_CONDITIONAL_CACHE", http_client.OrderedDict())
+    payload = {"standings": [1, 2, 3]}
+    session = _Session([fake_response(200, payload, {"ETag": '"v1"'}), fake_response(304)])
+    url = "https://api-web.nhle.com/v1/standings/now"
+
+    first = http_client.request_json(url, session=session, headers={"Origin": "x"}, revalidate=True)
+    assert first == payload
+    first["standings"] = []
+    assert http_client.request_json(url, session=session, headers={"Origin": "x"}, revalidate=True) == payload
+    assert session.sent_headers[1] == {"If-None-Match": '"v1"', "Origin": "x"}
+
+
+def test_cached_json_reuses_payload_until_it_expires(monkeypatch: pytest.MonkeyPatch, fake_response):
+    from services import http_client
+
+    monkeypatch.setattr(http_client, "_TTL_CACHE", {})
+    monkeypatch.setattr(http_client, "_CONDITIONAL_CACHE", http_client.OrderedDict())
+    clock = [100.0]
+    monkeypatch.setattr(http_client.time, "monotonic", lambda: clock[0])
+    session = _Session([fake_response(200, {"games": [1]}), fake_response(200, {"games": [2]})])
+    url = "https://api-web.nhle.com/v1/club-schedule-season/CHI/now"
+
+    first = http_client.cached_json(url, ttl=60, session=session)
+    assert first == {"games": [1]}
+    first["games"] = []
+    assert http_client.cached_json(url, ttl=60, session=session) == {"games": [1]}
+    assert len(session.sent_headers) == 1
+
+    clock[0] += 61
+    assert http_client.cached_json(url, ttl=60, session=session) == {"games": [2]}
+
+
+def test_request_json_does_not_remember_error_responses(monkeypatch: pytest.MonkeyPatch, fake_response):
+    from services import http_client
+
+    monkeypatch.setattr(http_client, "_CONDITIONAL_CACHE", http_client.OrderedDict())
+    session = _Session([fake_response(500, {"error": "boom"}, {"ETag": '"bad"'}), fake_response(200, {"ok": True})])
+    url = "https://api-web.nhle.com/v1/standings/now"
+
+    assert http_client.request_json(url, session=session, quiet=True, revalidate=True) is None
+    assert http_client.request_json(url, session=session, quiet=True, revalidate=True) == {"ok": True}
+    assert session.sent_headers[1] is None
+
+
+def test_request_json_only_revalidates_when_asked(monkeypatch: pytest.MonkeyPatch, fake_response):
+    from services import http_client
+
+    monkeypatch.setattr(http_client, "_CONDITIONAL_CACHE", http_client.OrderedDict())
+    session = _Session([fake_response(200, {"v": 1}, {"ETag": '"v1"'}), fake_response(200, {"v": 2})])
+    url = "https://api-web.nhle.com/v1/gamecenter/1/boxscore"
+
+    assert http_client.request_json(url, session=session) == {"v": 1}
+    assert http_client.request_json(url, session=session) == {"v": 2}
+    assert session.sent_headers == [None, None]
+    assert not http_client._CONDITIONAL_CACHE
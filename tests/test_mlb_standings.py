@@ -0,0 +1,36 @@
+from screens import mlb_standings
+
+
+LEAGUE_PAYLOAD = {
+    "records": [
+        {"division": {"id": 204}, "teamRecords": [{"divisionRank": "2", "id": 1}, {"divisionRank": "1", "id": 2}]},
+        {"division": {"id": 205}, "teamRecords": [{"divisionRank": "1", "id": 3}]},
+    ]
+}
+
+
+def test_division_screens_share_one_league_fetch(monkeypatch, fake_response):
+    monkeypatch.setattr(mlb_standings, "_RECORDS_CACHE", {})
+    urls = []
+
+    def fake_get(url, timeout=None):
+        urls.append(url)
+        return fake_response(200, LEAGUE_PAYLOAD)
+
+    monkeypatch.setattr(mlb_standings.requests, "get", fake_get)
+
+    east = mlb_standings.fetch_division_records(104, 204)
+    central = mlb_standings.fetch_division_records(104, 205)
+
+    assert [team["id"] for team in east] == [2, 1]
+    assert [team["id"] for team in central] == [3]
+    assert len(urls) == 1
+
+
+def test_failed_league_fetch_is_not_cached(monkeypatch, fake_response):
+    monkeypatch.setattr(mlb_standings, "_RECORDS_CACHE", {})
+    responses = [fake_response(503), fake_response(200, LEAGUE_PAYLOAD)]
+    monkeypatch.setattr(mlb_standings.requests, "get", lambda url, timeout=None: responses.pop(0))
+
+    assert mlb_standings.fetch_division_records(104, 204) == []
+    assert [team["id"] for team in mlb_standings.fetch_division_records(104, 204)] == [2, 1]
@@ -1,5 +1,9 @@
 import textwrap
 
+import numpy as np
+from PIL import Image
+
+from screens import nfl_standings
 from screens.nfl_standings import (
     CONFERENCE_AFC_KEY,
     CONFERENCE_NFC_KEY,
@@ -68,3 +72,37 @@ def test_parse_csv_standings_returns_empty_when_no_data():
     assert used_season is None
     assert standings[CONFERENCE_AFC_KEY] == {}
     assert standings[CONFERENCE_NFC_KEY] == {}
+
+
+CSV_MISSING_RANK = textwrap.dedent(
+    """\
+    season,conf,division,team,wins,losses,ties,pct,div_rank,scored,allowed,net,sov,sos,seed,playoff
+    2024,AFC,AFC East,MIA,10,7,0,0.588,,400,350,50,0.4,0.5,5,
+    2024,AFC,AFC East,BUF,11,6,0,0.647,,451,327,124,0.5,0.5,1,
+    2024,AFC,AFC East,NYJ,5,12,0,0.294,,300,400,-100,0.3,0.5,,
+    """
+)
+
+
+def test_parse_csv_standings_keeps_file_order_without_ranks():
+    standings, _ = _parse_csv_standings(CSV_MISSING_RANK, 2024)
+
+    afc_east = standings[CONFERENCE_AFC_KEY]["AFC East"]
+    assert [team["abbr"] for team in afc_east] == ["MIA", "BUF", "NYJ"]
+    assert [team["order"] for team in afc_east] == [1, 2, 3]
+
+
+def test_logo_sprites_blend_like_a_soft_alpha_paste():
+    rng = np.random.default_rng(0)
+    base = Image.fromarray(rng.integers(0, 256, (40, 40, 3), dtype=np.uint8))
+    logo = Image.fromarray(rng.integers(0, 256, (12, 10, 4), dtype=np.uint8), "RGBA")
+    bitmap, mask = nfl_standings._split_logo(logo)
+    assert mask.mode == "L"
+
+    expected = base.copy()
+    expected.paste(bitmap, (-3, 30), mask)
+    frame = np.asarray(base).copy()
+    sprite = (np.asarray(bitmap, dtype=np.uint32), np.asarray(mask, dtype=np.uint32)[..., None], -3)
+    nfl_standings._composite_sprites(frame, [sprite], [30])
+
+    assert frame.tobytes() == expected.tobytes()
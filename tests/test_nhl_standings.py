@@ -0,0 +1,290 @@
+from PIL import Image, ImageDraw
+
+from screens import nhl_standings
+
+
+STANDINGS = {
+    "Western": {
+        "Central": nhl_standings.TeamRows.from_teams(
+            [
+                {"abbr": "CHI", "wins": 30, "losses": 20, "ot": 5, "points": 65},
+                {"abbr": "STL", "wins": 28, "losses": 22, "ot": 4, "points": 60},
+            ]
+        )
+    }
+}
+
+
+def test_persisted_standings_seed_the_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(nhl_standings, "CACHE_PATH", str(tmp_path / "oled" / "nhl_standings.json"))
+    saved = {
+        "timestamp": 1234.5,
+        "data": STANDINGS,
+        "source": nhl_standings.API_WEB_STANDINGS_URL,
+        "etag": '"v1"',
+        "last_modified": None,
+    }
+    monkeypatch.setattr(nhl_standings, "_STANDINGS_CACHE", dict(saved))
+    nhl_standings._persist_standings()
+
+    monkeypatch.setattr(nhl_standings, "_STANDINGS_CACHE", {"timestamp": 0.0, "data": None})
+    nhl_standings._load_persisted_standings()
+
+    cache = nhl_standings._STANDINGS_CACHE
+    assert {key: cache[key] for key in ("timestamp", "source", "etag", "last_modified")} == {
+        key: saved[key] for key in ("timestamp", "source", "etag", "last_modified")
+    }
+    central = cache["data"]["Western"]["Central"]
+    assert central == STANDINGS["Western"]["Central"]
+    assert (central.wins_str[0], central.points_str[0]) == ("30", "65")
+
+
+def test_persisted_standings_are_read_on_first_cold_fetch(tmp_path, monkeypatch):
+    monkeypatch.setattr(nhl_standings, "CACHE_PATH", str(tmp_path / "nhl_standings.json"))
+    monkeypatch.setattr(nhl_standings, "_STANDINGS_CACHE", {"timestamp": 0.0, "data": STANDINGS})
+    nhl_standings._persist_standings()
+
+    monkeypatch.setattr(nhl_standings, "_STANDINGS_CACHE", {"timestamp": 0.0, "data": None})
+    monkeypatch.setattr(nhl_standings, "_persisted_loaded", False)
+    monkeypatch.setattr(nhl_standings, "_start_background_refresh", lambda: None)
+    monkeypatch.setattr(nhl_standings, "_refresh_standings", lambda: None)
+
+    assert nhl_standings._fetch_standings_data()["Western"]["Central"] == STANDINGS["Western"]["Central"]
+    assert nhl_standings._persisted_loaded
+
+
+def test_unreadable_persisted_standings_are_ignored(tmp_path, monkeypatch):
+    cache_path = tmp_path / "nhl_standings.json"
+    cache_path.write_text("{not json", encoding="utf-8")
+    monkeypatch.setattr(nhl_standings, "CACHE_PATH", str(cache_path))
+    monkeypatch.setattr(nhl_standings, "_STANDINGS_CACHE", {"timestamp": 0.0, "data": None})
+
+    nhl_standings._load_persisted_standings()
+
+    assert nhl_standings._STANDINGS_CACHE == {"timestamp": 0.0, "data": None}
+
+
+def test_not_modified_response_keeps_cached_standings(tmp_path, monkeypatch, fake_response):
+    monkeypatch.setattr(nhl_standings, "CACHE_PATH", str(tmp_path / "nhl_standings.json"))
+    monkeypatch.setattr(
+        nhl_standings,
+        "_STANDINGS_CACHE",
+        {
+            "timestamp": 0.0,
+            "data": STANDINGS,
+            "source": nhl_standings.API_WEB_STANDINGS_URL,
+            "etag": '"v1"',
+            "last_modified": None,
+        },
+    )
+    sent_headers = []
+
+    def fake_get(url, *, headers=None, **kwargs):
+        sent_headers.append(headers)
+        return fake_response(304)
+
+    monkeypatch.setattr(nhl_standings._SESSION, "get", fake_get)
+
+    assert nhl_standings._refresh_standings() is STANDINGS
+    assert sent_headers[0]["If-None-Match"] == '"v1"'
+    assert nhl_standings._STANDINGS_CACHE["timestamp"] > 0
+    assert not (tmp_path / "nhl_standings.json").exists()
+
+
+def test_identical_payload_skips_parsing(tmp_path, monkeypatch, fake_response):
+    monkeypatch.setattr(nhl_standings, "CACHE_PATH", str(tmp_path / "nhl_standings.json"))
+    monkeypatch.setattr(nhl_standings, "_STANDINGS_CACHE", {"timestamp": 0.0, "data": None})
+    monkeypatch.setattr(nhl_standings, "_PARSER_CHOICE", {})
+    monkeypatch.setattr(nhl_standings._SESSION, "get", lambda url, **kwargs: fake_response(200, API_WEB_PAYLOAD))
+
+    first = nhl_standings._refresh_standings()
+    assert first
+
+    def fail_parse(payload):
+        raise AssertionError("unchanged payload should not be parsed")
+
+    monkeypatch.setattr(nhl_standings, "_parse_api_web_payload", fail_parse)
+    cache_file = tmp_path / "nhl_standings.json"
+    cache_file.unlink()
+    assert nhl_standings._refresh_standings() is first
+    assert not cache_file.exists()
+
+
+def test_extract_stat_reads_direct_keys_and_stat_lists():
+    row = {
+        "w": "31",
+        "stats": [
+            {"name": "goalsFor", "value": 200},
+            {"abbreviation": "OTL", "value": 7},
+            {"type": "Points", "statValue": 69},
+        ],
+    }
+
+    assert nhl_standings._extract_stat(row, nhl_standings._WINS_STAT) == 31
+    assert nhl_standings._extract_stat(row, nhl_standings._OT_STAT) == 7
+    assert nhl_standings._extract_stat(row, nhl_standings._POINTS_STAT) == 69
+    assert nhl_standings._extract_stat(row, nhl_standings._LOSSES_STAT) == 0
+
+
+API_WEB_PAYLOAD = {
+    "wildCardIndicator": True,
+    "standings": [
+        {
+            "conferenceName": "Western",
+            "divisionName": "Central",
+            "teamAbbrev": {"default": "CHI"},
+            "teamName": {"default": "Chicago Blackhawks"},
+            "wins": 30,
+            "losses": 20,
+            "otLosses": 5,
+            "points": 65,
+            "divisionSequence": 1,
+            "streak": {"code": "W", "count": 2},
+        },
+        {
+            "conferenceName": "Eastern",
+            "divisionName": "Atlantic",
+            "teamAbbrev": {"default": "BOS"},
+            "wins": 25,
+            "losses": 25,
+            "otLosses": 3,
+            "points": 53,
+            "divisionSequence": 4,
+        },
+    ],
+}
+
+
+def test_parse_generic_standings_reads_api_web_rows():
+    standings = nhl_standings._parse_generic_standings(API_WEB_PAYLOAD)
+
+    central = standings["Western"]["Central"]
+    assert [(t["abbr"], t["wins"], t["losses"], t["ot"], t["points"]) for t in central] == [
+        ("CHI", 30, 20, 5, 65)
+    ]
+    assert [t["abbr"] for t in standings["Eastern"]["Atlantic"]] == ["BOS"]
+
+
+def test_api_web_parser_choice_is_remembered_and_revalidated(monkeypatch):
+    monkeypatch.setattr(nhl_standings, "_PARSER_CHOICE", {})
+    url = nhl_standings.API_WEB_STANDINGS_URL
+    grouped = {
+        "records": [
+            {
+                "teamRecords": [
+                    {"conferenceName": "Western", "divisionName": "Pacific", "teamAbbrev": "SEA", "wins": 1}
+                ]
+            }
+        ]
+    }
+
+    standings = nhl_standings._parse_api_web_payload(grouped)
+    assert [t["abbr"] for t in standings["Western"]["Pacific"]] == ["SEA"]
+    assert nhl_standings._PARSER_CHOICE[url] == "grouped"
+
+    # A feed that no longer fits the remembered parser falls back to the chain.
+    assert nhl_standings._parse_api_web_payload(API_WEB_PAYLOAD)
+    assert nhl_standings._PARSER_CHOICE[url] == "generic"
+
+
+def test_index_logo_files_prefers_the_old_probe_order(tmp_path):
+    for name in ("CHI.png", "bos.png", "Sea.png", "nhl.png", "NHL.png", "notes.txt"):
+        (tmp_path / name).write_bytes(b"")
+
+    assert nhl_standings._index_logo_files(str(tmp_path)) == {
+        "CHI": "CHI",
+        "BOS": "bos",
+        "SEA": "Sea",
+        "NHL": "NHL",
+    }
+
+
+def test_stale_standings_are_served_while_refreshing_in_background(monkeypatch):
+    monkeypatch.setattr(nhl_standings, "_STANDINGS_CACHE", {"timestamp": 0.0, "data": STANDINGS})
+    started = []
+    monkeypatch.setattr(nhl_standings, "_start_background_refresh", lambda: started.append(True))
+
+    def blocking_refresh():
+        raise AssertionError("render path should not fetch")
+
+    monkeypatch.setattr(nhl_standings, "_refresh_standings", blocking_refresh)
+
+    assert nhl_standings._fetch_standings_data() is STANDINGS
+    assert started == [True]
+
+
+def test_overview_grid_is_prepared_once_per_team_order(monkeypatch):
+    monkeypatch.setattr(nhl_standings, "_OVERVIEW_IMG_CACHE", {})
+    prepared = []
+    real_prepare = nhl_standings._prepare_overview
+
+    def counting_prepare(divisions):
+        prepared.append(divisions)
+        return real_prepare(divisions)
+
+    monkeypatch.setattr(nhl_standings, "_prepare_overview", counting_prepare)
+    divisions = [("Central", STANDINGS["Western"]["Central"])]
+
+    first = nhl_standings._overview_cached(divisions)
+    assert nhl_standings._overview_cached(divisions) is first
+    reordered = nhl_standings.TeamRows.from_teams(STANDINGS["Western"]["Central"].as_teams()[::-1])
+    nhl_standings._overview_cached([("Central", reordered)])
+    assert len(prepared) == 2
+
+
+def test_text_stamp_matches_drawn_text():
+    font = nhl_standings.ROW_FONT
+    drawn = Image.new("RGB", (60, 30), "black")
+    ImageDraw.Draw(drawn).text((7, 5), "CHI 65", font=font, fill=nhl_standings.WHITE)
+
+    stamped = Image.new("RGB", (60, 30), "black")
+    stamp, dx, dy = nhl_standings._text_stamp("CHI 65", font)
+    stamped.paste(nhl_standings.WHITE, (7 + dx, 5 + dy), stamp)
+
+    assert stamped.tobytes() == drawn.tobytes()
+
+
+def test_text_stamp_falls_back_to_textsize(monkeypatch):
+    real = nhl_standings._MEASURE_DRAW
+
+    class _OldDraw:
+        # Pillow before textbbox: sizes are measured from the draw origin.
+        def textsize(self, text, font):
+            return real.textbbox((0, 0), text, font=font)[2:]
+
+    monkeypatch.setattr(nhl_standings, "_MEASURE_DRAW", _OldDraw())
+    nhl_standings._text_stamp.cache_clear()
+    try:
+        font = nhl_standings.ROW_FONT
+        drawn = Image.new("RGB", (60, 30), "black")
+        ImageDraw.Draw(drawn).text((7, 5), "CHI 65", font=font, fill=nhl_standings.WHITE)
+
+        stamped = Image.new("RGB", (60, 30), "black")
+        stamp, dx, dy = nhl_standings._text_stamp("CHI 65", font)
+        stamped.paste(nhl_standings.WHITE, (7 + dx, 5 + dy), stamp)
+    finally:
+        nhl_standings._text_stamp.cache_clear()
+
+    assert (dx, dy) == (0, 0)
+    assert stamped.tobytes() == drawn.tobytes()
+
+
+def test_statsapi_dns_success_is_cached(monkeypatch):
+    monkeypatch.setattr(nhl_standings, "_dns_ok_until", 0.0)
+    monkeypatch.setattr(nhl_standings, "_dns_block_until", 0.0)
+    lookups = []
+    monkeypatch.setattr(nhl_standings.socket, "getaddrinfo", lambda host, port: lookups.append(host))
+
+    assert nhl_standings._statsapi_available()
+    assert nhl_standings._statsapi_available()
+    assert lookups == [nhl_standings.STATSAPI_HOST]
+
+
+def test_failed_refresh_leaves_cached_standings_alone(tmp_path, monkeypatch, fake_response):
+    monkeypatch.setattr(nhl_standings, "CACHE_PATH", str(tmp_path / "nhl_standings.json"))
+    monkeypatch.setattr(nhl_standings, "_STANDINGS_CACHE", {"timestamp": 5.0, "data": STANDINGS})
+    monkeypatch.setattr(nhl_standings, "_statsapi_available", lambda: False)
+    monkeypatch.setattr(nhl_standings._SESSION, "get", lambda url, **kwargs: fake_response(502))
+
+    assert nhl_standings._refresh_standings() is None
+    assert nhl_standings._STANDINGS_CACHE == {"timestamp": 5.0, "data": STANDINGS}
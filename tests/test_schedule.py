@@ -151,3 +151,34 @@ def test_all_zero_frequencies_raise_error():
 
     with pytest.raises(ValueError):
         build_scheduler(config)
+
+
+def test_screen_catalog_ids_are_unique():
+    from screens_catalog import SCREEN_ID_SET, SCREEN_IDS
+
+    assert len(SCREEN_ID_SET) == len(SCREEN_IDS)
+
+
+def test_every_registered_screen_is_in_the_catalog():
+    import ast
+    from pathlib import Path
+
+    import screens.registry
+    from screens_catalog import SCREEN_ID_SET
+
+    tree = ast.parse(Path(screens.registry.__file__).read_text(encoding="utf-8"))
+    registered = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, "id", None) in ("register", "register_logo"):
+            first = node.args[0] if node.args else None
+            if isinstance(first, ast.Constant) and isinstance(first.value, str):
+                registered.add(first.value)
+        elif isinstance(node, ast.For) and isinstance(node.iter, ast.Tuple) and any(
+            getattr(getattr(call, "func", None), "id", None) == "register_logo" for call in ast.walk(node)
+        ):
+            registered.update(
+                elt.value for elt in node.iter.elts if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+            )
+
+    assert len(registered) > 40
+    assert registered <= SCREEN_ID_SET
@@ -0,0 +1,136 @@
+from services import wifi_utils
+
+
+def test_check_internet_shares_one_deadline_across_urls(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(wifi_utils.time, "monotonic", lambda: clock[0])
+    timeouts = []
+
+    def stalled_head(url, *, timeout, allow_redirects):
+        timeouts.append(timeout)
+        clock[0] += wifi_utils.INTERNET_TIMEOUT + 1
+        raise OSError("stalled")
+
+    monkeypatch.setattr(wifi_utils, "TCP_CHECK_HOSTS", ())
+    monkeypatch.setattr(wifi_utils._PROBE_SESSION, "head", stalled_head)
+
+    assert wifi_utils._check_internet() is False
+    budget = wifi_utils.INTERNET_TIMEOUT * 2
+    assert timeouts[0] == (wifi_utils.INTERNET_TIMEOUT, wifi_utils.INTERNET_TIMEOUT)
+    assert timeouts[1] == (budget - timeouts[0][0] - 1,) * 2
+
+
+def test_check_internet_skips_https_when_a_resolver_answers(monkeypatch):
+    connected = []
+
+    class _Socket:
+        def close(self):
+            pass
+
+    def fake_connect(address, timeout):
+        connected.append(address)
+        if address[0] == "1.1.1.1":
+            raise OSError("blocked")
+        return _Socket()
+
+    def unexpected_head(*args, **kwargs):
+        raise AssertionError("HTTPS probe should not run")
+
+    monkeypatch.setattr(wifi_utils.socket, "create_connection", fake_connect)
+    monkeypatch.setattr(wifi_utils._PROBE_SESSION, "head", unexpected_head)
+
+    assert wifi_utils._check_internet() is True
+    assert connected == [("1.1.1.1", 53), ("8.8.8.8", 53)]
+
+
+class _Proxy:
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+
+class _Bus:
+    def __init__(self, objects):
+        self.objects = objects
+
+    def get(self, service, path="/org/freedesktop/NetworkManager"):
+        return self.objects[path]
+
+
+def test_ssid_is_read_from_networkmanager_over_dbus(monkeypatch):
+    settings = {"802-11-wireless": {"ssid": list(b"Cafe: 5G")}}
+    objects = {
+        "/org/freedesktop/NetworkManager": _Proxy(ActiveConnections=["/ac/eth", "/ac/wifi"]),
+        "/ac/eth": _Proxy(Type="802-3-ethernet", Connection="/settings/eth"),
+        "/ac/wifi": _Proxy(Type="802-11-wireless", Connection="/settings/wifi"),
+        "/settings/wifi": _Proxy(GetSettings=lambda: settings),
+    }
+    monkeypatch.setattr(wifi_utils, "SystemBus", lambda: _Bus(objects))
+
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError("subprocess fallback should not run")
+
+    monkeypatch.setattr(wifi_utils.subprocess, "check_output", no_subprocess)
+
+    assert wifi_utils._get_ssid() == "Cafe: 5G"
+
+
+def test_poll_interval_backs_off_only_while_online():
+    intervals = [wifi_utils._next_interval("ok", cycles) for cycles in range(10)]
+    fast = wifi_utils.FAST_CHECK_CYCLES
+
+    assert intervals[:fast] == [wifi_utils.FAST_CHECK_INTERVAL] * fast
+    assert intervals[fast] == wifi_utils.CHECK_INTERVAL
+    assert intervals[fast:] == sorted(intervals[fast:])
+    assert intervals[-1] == wifi_utils.MAX_CHECK_INTERVAL
+    assert wifi_utils._next_interval("no_internet", 10) == wifi_utils.CHECK_INTERVAL
+
+
+def test_monitor_wakes_for_refresh_and_stops_promptly(monkeypatch):
+    checks = []
+    monkeypatch.setattr(wifi_utils, "_state", wifi_utils._state)
+    monkeypatch.setattr(wifi_utils, "_check_internet", lambda: checks.append(True) or True)
+    monkeypatch.setattr(wifi_utils, "_get_ssid", lambda: "home")
+    monkeypatch.setattr(wifi_utils, "CHECK_INTERVAL", 60)
+    monkeypatch.setattr(wifi_utils, "FAST_CHECK_INTERVAL", 60)
+
+    thread = wifi_utils.start_monitor()
+    try:
+        deadline = wifi_utils.time.monotonic() + 2
+        while not checks and wifi_utils.time.monotonic() < deadline:
+            wifi_utils.time.sleep(0.01)
+        wifi_utils.force_refresh()
+        while len(checks) < 2 and wifi_utils.time.monotonic() < deadline:
+            wifi_utils.time.sleep(0.01)
+        assert len(checks) >= 2
+        assert wifi_utils.get_state() == ("ok", "home")
+    finally:
+        wifi_utils.stop_monitor()
+        thread.join(timeout=2)
+    assert not thread.is_alive()
+
+
+def test_refresh_requested_during_a_check_is_not_lost(monkeypatch):
+    checks = []
+
+    def check():
+        checks.append(True)
+        if len(checks) == 1:
+            wifi_utils.force_refresh()
+        return True
+
+    monkeypatch.setattr(wifi_utils, "_state", wifi_utils._state)
+    monkeypatch.setattr(wifi_utils, "_check_internet", check)
+    monkeypatch.setattr(wifi_utils, "_get_ssid", lambda: "home")
+    monkeypatch.setattr(wifi_utils, "CHECK_INTERVAL", 60)
+    monkeypatch.setattr(wifi_utils, "FAST_CHECK_INTERVAL", 60)
+
+    thread = wifi_utils.start_monitor()
+    try:
+        deadline = wifi_utils.time.monotonic() + 2
+        while len(checks) < 2 and wifi_utils.time.monotonic() < deadline:
+            wifi_utils.time.sleep(0.01)
+        assert len(checks) >= 2
+    finally:
+        wifi_utils.stop_monitor()
+        thread.join(timeout=2)
+    assert not thread.is_alive()
@@ -22,6 +22,7 @@ from typing import Any, Dict, List, Optional
 import functools
 import logging
 import math
+import numpy as np
 import requests
 import spidev
 from io import BytesIO
@@ -42,7 +43,7 @@ except AttributeError:
     Image.ANTIALIAS = Image.Resampling.LANCZOS
 
 # OLED driver
-from waveshare_OLED.OLED_1in5_rgb import OLED_1in5_rgb
+from waveshare_OLED.OLED_1in5_rgb import OLED_1in5_rgb, pack_rgb565
 # Project config
 from config import WIDTH, HEIGHT, CENTRAL_TIME, SPI_FREQUENCY
 # Color utilities
@@ -75,13 +76,50 @@ class Display:
         if self.disp.Init() == -1:
             raise RuntimeError("Failed to initialize SSD1351")
         self.width, self.height = self.disp.width, self.disp.height
+        # RGB565 copy of what the panel currently shows (None = unknown), so
+        # full-frame pushes only send the rows that actually changed.
+        self._shadow: Optional[np.ndarray] = None
 
     def clear(self):
         self.disp.clear()
+        self._shadow = np.zeros((self.height, self.width, 2), dtype=np.uint8)
 
     def image(self, pil_img: Image.Image):
-        buf = self.disp.getbuffer(pil_img)
-        self.disp.ShowImage(buf)
+        rgb = pil_img if isinstance(pil_img, np.ndarray) else np.asarray(pil_img.convert("RGB"))
+        packed = pack_rgb565(rgb[:self.height, :self.width])
+        if packed.shape[:2] != (self.height, self.width):
+            self.disp.ShowImage(packed.ravel().tolist())
+            self._shadow = None
+            return
+
+        top, bottom = 0, self.height
+        if self._shadow is not None:
+            changed = np.flatnonzero((packed != self._shadow).any(axis=(1, 2)))
+            if not changed.size:
+                return
+            top, bottom = int(changed[0]), int(changed[-1]) + 1
+        self.disp.ShowImage(packed[top:bottom], (0, top, self.width - 1, bottom - 1))
+        self._shadow = packed
+
+    def image_region(self, pil_img: Image.Image, box: tuple[int, int, int, int]):
+        """Push *pil_img* into the ``(left, top, right, bottom)`` area only.
+
+        An ``HxWx3`` uint8 array is accepted as well and packed directly.
+        """
+        rgb = pil_img if isinstance(pil_img, np.ndarray) else np.asarray(pil_img.convert("RGB"))
+        self.write_raw(pack_rgb565(rgb), box)
+
+    def write_raw(self, buf, box: tuple[int, int, int, int]):
+        """Push pre-packed RGB565 bytes (see ``pack_rgb565``) into *box*.
+
+        *buf* must be contiguous and hold exactly the box's pixels, e.g. a
+        row slice of a packed image that is as wide as the panel.
+        """
+        left, top, right, bottom = box
+        self.disp.ShowImage(buf, (left, top, right - 1, bottom - 1))
+        if self._shadow is not None:
+            pixels = np.frombuffer(buf, dtype=np.uint8)
+            self._shadow[top:bottom, left:right] = pixels.reshape(bottom - top, right - left, 2)
 
     def show(self):
         # No-op: ShowImage pushes the buffer
@@ -253,8 +291,14 @@ def animate_scroll(display: Display, image: Image.Image, speed=3, y_offset=None)
         return
 
     bands = image.getbands() if hasattr(image, "getbands") else ()
-    has_alpha = "A" in bands
-    image = image.convert("RGBA" if has_alpha else "RGB")
+    if "A" in bands:
+        # Flatten onto black once; pasting the RGB result per frame matches
+        # the old per-frame RGBA paste + convert without redoing the blend.
+        rgba = image.convert("RGBA")
+        image = Image.new("RGB", rgba.size, (0, 0, 0))
+        image.paste(rgba, (0, 0), rgba)
+    else:
+        image = image.convert("RGB")
 
     w, h = display.width, display.height
     img_w, img_h = image.size
@@ -262,20 +306,75 @@ def animate_scroll(display: Display, image: Image.Image, speed=3, y_offset=None)
     direction = random.choice(("ltr", "rtl"))
     start, end, step = ((-img_w, w, speed) if direction == "ltr" else (w, -img_w, -speed))
 
-    background_color = (0, 0, 0, 0) if has_alpha else (0, 0, 0)
-    frame_mode = "RGBA" if has_alpha else "RGB"
-
     for x in range(start, end, step):
-        frame = Image.new(frame_mode, (w, h), background_color)
-        if has_alpha:
-            frame.paste(image, (x, y), image)
-            frame_to_show = frame.convert("RGB")
-        else:
-            frame.paste(image, (x, y))
-            frame_to_show = frame
-        display.image(frame_to_show)
+        frame = Image.new("RGB", (w, h), (0, 0, 0))
+        frame.paste(image, (x, y))
+        display.image(frame)
         time.sleep(0.01)
 
+def sleep_until(deadline: float, interval: float) -> float:
+    """Sleep until *deadline* and return the next frame's deadline.
+
+    Frame cost is absorbed into the delay; if a frame overruns by more than a
+    whole interval the schedule restarts rather than bursting to catch up.
+    """
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+    elif remaining < -interval:
+        deadline = time.monotonic()
+    return deadline + interval
+
+def changed_band(pixels: np.ndarray, shown: np.ndarray) -> Optional[tuple[int, int]]:
+    """Return the ``(top, bottom)`` row span where *pixels* differs from *shown*."""
+    changed = np.flatnonzero((pixels != shown).any(axis=(1, 2)))
+    if not changed.size:
+        return None
+    return int(changed[0]), int(changed[-1]) + 1
+
+def scroll_vertical(display, image: Image.Image, step: int, delay: float,
+                    pause_top: float, pause_bottom: float):
+    """
+    Scroll a tall image up through the display, one *step* rows per frame.
+    """
+    pixels = np.asarray(image.convert("RGB"))
+    shown = pixels[:HEIGHT]
+    show = getattr(display, "show", None)
+    display.image(Image.fromarray(shown))
+    if show is not None:
+        show()
+    time.sleep(pause_top)
+
+    # Only the band of rows that differs from the previous frame is sent, and
+    # identical windows (blank gaps between sections) send nothing at all.
+    # With write_raw the strip is packed to RGB565 once and each band is a
+    # contiguous slice of it; image_region gets an array slice instead.
+    write_raw = push_region = packed = None
+    if image.width == WIDTH:
+        write_raw = getattr(display, "write_raw", None)
+        push_region = getattr(display, "image_region", None)
+    if write_raw is not None:
+        packed = pack_rgb565(pixels).reshape(image.height, WIDTH * 2)
+
+    deadline = time.monotonic() + delay
+    for offset in range(step, image.height - HEIGHT + 1, step):
+        window = pixels[offset:offset + HEIGHT]
+        band = changed_band(window, shown)
+        if band is not None:
+            shown = window
+            top, bottom = band
+            if packed is not None:
+                write_raw(packed[offset + top:offset + bottom], (0, top, WIDTH, bottom))
+            elif push_region is not None:
+                push_region(window[top:bottom], (0, top, WIDTH, bottom))
+            else:
+                display.image(Image.fromarray(window))
+                if show is not None:
+                    show()
+        deadline = sleep_until(deadline, delay)
+
+    time.sleep(pause_bottom)
+
 # ─── Date & Time Helpers ─────────────────────────────────────────────────────
 def parse_game_date(iso_date_str: str, time_str: str = "TBD") -> str:
     try:
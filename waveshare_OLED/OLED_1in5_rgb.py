@@ -10,6 +10,17 @@ Device_I2C = config.Device_I2C
 OLED_WIDTH   = 128
 OLED_HEIGHT  = 128
 
+def pack_rgb565(rgb: np.ndarray) -> np.ndarray:
+    """Pack an ``HxWx3`` uint8 array into an ``HxWx2`` array of RGB565 bytes."""
+    r = rgb[..., 0]
+    g = rgb[..., 1]
+    b = rgb[..., 2]
+    buf = np.empty(rgb.shape[:2] + (2,), dtype=np.uint8)
+    buf[..., 0] = (r & 0xF8) | (g >> 5)
+    buf[..., 1] = ((g << 3) & 0xE0) | (b >> 3)
+    return buf
+
+
 class OLED_1in5_rgb(config.RaspberryPi):
     """Driver for the Waveshare 1.5\" RGB SSD1351 display over SPI."""
 
@@ -69,38 +80,43 @@ class OLED_1in5_rgb(config.RaspberryPi):
         buf = [0x00] * (self.width * self.height * 2)
         self.ShowImage(buf)
 
-    def getbuffer(self, image: Image.Image) -> list[int]:
-        im = image.convert("RGB")
-        pix = im.load()
-        buf = [0] * (self.width * self.height * 2)
-        idx = 0
-        for y in range(self.height):
-            for x in range(self.width):
-                r, g, b = pix[x, y]
-                buf[idx]     = ((r & 0xF8) | (g >> 5)) & 0xFF
-                buf[idx + 1] = (((g << 3) & 0xE0) | (b >> 3)) & 0xFF
-                idx += 2
-        return buf
-
-    def ShowImage(self, pBuf: list[int]):
-        # 1) set column window 0→127
+    def getbuffer(self, image) -> list[int]:
+        """Pack an RGB image (PIL or HxWx3 uint8 array) into RGB565 bytes."""
+        if isinstance(image, np.ndarray):
+            rgb = image
+        else:
+            rgb = np.asarray(image.convert("RGB"))
+        return pack_rgb565(rgb[:self.height, :self.width]).ravel().tolist()
+
+    def ShowImage(self, pBuf, window: tuple[int, int, int, int] | None = None):
+        """Write *pBuf* into the inclusive ``(x0, y0, x1, y1)`` window (default: full screen).
+
+        *pBuf* is the list from :meth:`getbuffer` or any contiguous bytes-like
+        RGB565 buffer, such as rows sliced from :func:`pack_rgb565` output.
+        """
+        x0, y0, x1, y1 = window or (0, 0, self.width - 1, self.height - 1)
+
+        # 1) set column window
         self.command(0x15)
-        self.data(0x00)
-        self.data(0x7F)
+        self.data(x0)
+        self.data(x1)
 
-        # 2) set row window 0→127
+        # 2) set row window
         self.command(0x75)
-        self.data(0x00)
-        self.data(0x7F)
+        self.data(y0)
+        self.data(y1)
 
         # 3) RAM write command + data mode
         self.command(0x5C)
         self.digital_write(self.DC_PIN, True)
 
         # 4) send entire buffer in large chunks
-        CHUNK = 4096
-        for i in range(0, len(pBuf), CHUNK):
-            self.spi_writebyte(pBuf[i:i+CHUNK])
+        if not isinstance(pBuf, list):
+            self.spi_writebuffer(pBuf)
+        else:
+            CHUNK = 4096
+            for i in range(0, len(pBuf), CHUNK):
+                self.spi_writebyte(pBuf[i:i+CHUNK])
 
         # 5) back to command mode
         self.digital_write(self.DC_PIN, False)
@@ -58,6 +58,20 @@ class RaspberryPi:
         """
         self.spi.writebytes(data)
 
+    def spi_writebuffer(self, data):
+        """
+        Write a bytes-like buffer (bytes, memoryview, NumPy array) over SPI.
+        spidev's writebytes2 reads the buffer directly and splits it into
+        transfers itself, so no per-byte Python list is built.
+        """
+        writebytes2 = getattr(self.spi, "writebytes2", None)
+        if writebytes2 is not None:
+            writebytes2(data)
+            return
+        raw = memoryview(data).cast("B")
+        for i in range(0, len(raw), 4096):
+            self.spi.writebytes(list(raw[i:i + 4096]))
+
     def i2c_writebyte(self, reg, value):
         self.bus.write_byte_data(self.address, reg, value)
 